@@ -6,63 +6,161 @@ Handles database connection and initialization for SQLite
 import sqlite3
 import streamlit as st
 import os
+import queue
 import random
 from typing import Optional, Any
 from pathlib import Path
 from datetime import date, timedelta
 
+class SQLiteConnectionPool:
+    """Small pool of long-lived SQLite connections shared across sessions.
+
+    Connections are created lazily up to max_connections and reused, so each
+    query keeps the per-connection page cache warm instead of paying a fresh
+    connect + PRAGMA setup."""
+
+    def __init__(self, db_path, max_connections: int = 8):
+        self.db_path = db_path
+        self._pool = queue.Queue(maxsize=max_connections)
+
+    def _create_connection(self):
+        conn = sqlite3.connect(
+            str(self.db_path),
+            check_same_thread=False,
+            timeout=30.0,
+            isolation_level=None,  # Autocommit mode
+            cached_statements=256  # Keep compiled statements for repeat queries
+        )
+        conn.execute("PRAGMA foreign_keys = ON")
+        conn.execute("PRAGMA journal_mode = WAL")
+        conn.execute("PRAGMA synchronous = NORMAL")
+        conn.execute("PRAGMA cache_size = -64000")
+        conn.execute("PRAGMA temp_store = MEMORY")
+        # Read the database through the page cache via mmap where possible
+        conn.execute("PRAGMA mmap_size = 268435456")
+        # Lets SQLite treat full-table DELETEs as truncates
+        conn.execute("PRAGMA secure_delete = OFF")
+        return conn
+
+    def acquire(self):
+        """Check out a pooled connection, creating one if the pool is empty"""
+        try:
+            return self._pool.get_nowait()
+        except queue.Empty:
+            return self._create_connection()
+
+    def release(self, conn):
+        """Return a connection to the pool; close it if the pool is full"""
+        try:
+            self._pool.put_nowait(conn)
+        except queue.Full:
+            conn.close()
+
+    def close_all(self):
+        """Close every pooled connection"""
+        while True:
+            try:
+                self._pool.get_nowait().close()
+            except queue.Empty:
+                break
+
 class DatabaseManager:
     """Database connection manager for SQLite"""
 
     def __init__(self):
-        self.connection = None
+        self.pool = None
         self.db_path = Path(__file__).parent.parent / "student_tracker.db"
 
     def get_connection(self):
         """Get database connection with optimizations"""
         try:
-            conn = sqlite3.connect(
-                str(self.db_path),
-                check_same_thread=False,
-                timeout=30.0,
-                isolation_level=None  # Autocommit mode
-            )
-            conn.execute("PRAGMA foreign_keys = ON")
-            conn.execute("PRAGMA journal_mode = WAL")
-            conn.execute("PRAGMA synchronous = NORMAL")
-            conn.execute("PRAGMA cache_size = 1000")
-            conn.execute("PRAGMA temp_store = MEMORY")
-            return conn
+            return self.pool.acquire()
         except Exception as e:
             st.error(f"Database connection failed: {e}")
             return None
 
     def connect(self) -> bool:
-        """Establish database connection"""
-        self.connection = self.get_connection()
-        return self.connection is not None
+        """Set up the connection pool and verify a connection can be opened"""
+        try:
+            self.pool = SQLiteConnectionPool(self.db_path)
+            self.pool.release(self.pool._create_connection())
+            return True
+        except Exception as e:
+            st.error(f"Database connection failed: {e}")
+            return False
 
     def disconnect(self):
-        """Close database connection"""
-        if self.connection:
-            self.connection.close()
+        """Close all pooled connections"""
+        if self.pool:
+            self.pool.close_all()
 
     def execute_query(self, query: str, params: tuple = None) -> bool:
         """Execute INSERT, UPDATE, DELETE queries"""
+        conn = self.pool.acquire()
         try:
-            cursor = self.connection.cursor()
+            cursor = conn.cursor()
             cursor.execute(query, params or ())
-            self.connection.commit()
+            conn.commit()
             cursor.close()
             return True
         except Exception as e:
             st.error(f"Query execution failed: {e}")
             return False
+        finally:
+            self.pool.release(conn)
+
+    # Commit very large batches in slices so the WAL cannot grow unbounded
+    # during a bulk import
+    MANY_COMMIT_ROWS = 10_000
+
+    def execute_many(self, query: str, rows: list) -> int:
+        """Run one statement for many parameter rows, committing every
+        MANY_COMMIT_ROWS so WAL growth stays capped. Returns the number of
+        rows written (possibly partial if a later slice fails)."""
+        conn = self.pool.acquire()
+        count = 0
+        try:
+            cursor = conn.cursor()
+            for start in range(0, len(rows), self.MANY_COMMIT_ROWS):
+                cursor.execute("BEGIN")
+                cursor.executemany(query, rows[start:start + self.MANY_COMMIT_ROWS])
+                count += cursor.rowcount
+                conn.commit()
+            cursor.close()
+            return count
+        except Exception as e:
+            try:
+                conn.rollback()
+            except Exception:
+                pass
+            st.error(f"Bulk execution failed: {e}")
+            return count
+        finally:
+            self.pool.release(conn)
+
+    def execute_script(self, sql: str) -> bool:
+        """Run several statements in one transaction (single commit/fsync)"""
+        conn = self.pool.acquire()
+        try:
+            conn.executescript(f"BEGIN IMMEDIATE; {sql} COMMIT;")
+            return True
+        except Exception as e:
+            # Unwind the explicit BEGIN so the connection goes back to the
+            # pool outside any transaction
+            try:
+                conn.rollback()
+            except Exception:
+                pass
+            st.error(f"Script execution failed: {e}")
+            return False
+        finally:
+            self.pool.release(conn)
 
     def fetch_all(self, query: str, params: tuple = None) -> list:
         """Fetch all results from SELECT query"""
+        conn = self.pool.acquire()
         try:
-            cursor = self.connection.cursor()
+            cursor = conn.cursor()
             cursor.execute(query, params or ())
             result = cursor.fetchall()
             cursor.close()
@@ -70,11 +168,29 @@ class DatabaseManager:
         except Exception as e:
             st.error(f"Query fetch failed: {e}")
             return []
+        finally:
+            self.pool.release(conn)
+
+    def fetch_df(self, query: str, params: tuple = None):
+        """Fetch SELECT results straight into a DataFrame: pandas drains the
+        cursor in large batches in C instead of building one Python tuple per
+        row. pandas loads lazily so importing this module stays cheap."""
+        import pandas as pd
+
+        conn = self.pool.acquire()
+        try:
+            return pd.read_sql_query(query, conn, params=params or ())
+        except Exception as e:
+            st.error(f"Query fetch failed: {e}")
+            return pd.DataFrame()
+        finally:
+            self.pool.release(conn)
 
     def fetch_one(self, query: str, params: tuple = None) -> Optional[tuple]:
         """Fetch single result from SELECT query"""
+        conn = self.pool.acquire()
         try:
-            cursor = self.connection.cursor()
+            cursor = conn.cursor()
             cursor.execute(query, params or ())
             result = cursor.fetchone()
             cursor.close()
@@ -82,6 +198,8 @@ class DatabaseManager:
         except Exception as e:
             st.error(f"Query fetch failed: {e}")
             return None
+        finally:
+            self.pool.release(conn)
 
 # Global database instance
 @st.cache_resource
@@ -96,6 +214,14 @@ def execute_query(query: str, params: tuple = None) -> bool:
     db = get_db_connection()
     return db.execute_query(query, params) if db else False
 
+def execute_many(query: str, rows: list) -> int:
+    db = get_db_connection()
+    return db.execute_many(query, rows) if db else 0
+
+def execute_script(sql: str) -> bool:
+    db = get_db_connection()
+    return db.execute_script(sql) if db else False
+
 def fetch_all(query: str, params: tuple = None) -> list:
     db = get_db_connection()
     return db.fetch_all(query, params) if db else []
@@ -104,6 +230,26 @@ def fetch_one(query: str, params: tuple = None) -> Optional[tuple]:
     db = get_db_connection()
     return db.fetch_one(query, params) if db else None
 
+def fetch_df(query: str, params: tuple = None):
+    import pandas as pd
+    db = get_db_connection()
+    return db.fetch_df(query, params) if db else pd.DataFrame()
+
+def db_is_empty() -> bool:
+    """True when no students, subjects or marks exist.
+
+    One EXISTS over a UNION ALL stops at the first row found in any table,
+    so the common first-run check costs a single probe instead of three
+    COUNT scans."""
+    row = fetch_one("""
+        SELECT EXISTS(
+            SELECT 1 FROM Student
+            UNION ALL SELECT 1 FROM Subject
+            UNION ALL SELECT 1 FROM Marks
+        )
+    """)
+    return not (row and row[0])
+
 # Initialization logic
 def initialize_sample_data():
     try:
@@ -114,6 +260,10 @@ def initialize_sample_data():
 
         print("Inserting sample data...")
 
+        # Sentinel row lets sample-data detection read one key instead of
+        # probing student names
+        execute_query("INSERT OR REPLACE INTO Meta (key, val) VALUES ('sample_marker', 'v1')")
+
         sample_students = [
             ("Aarav Sharma", "10", "A", "2008-05-20"),
             ("Priya Patel", "10", "A", "2008-03-15"),
@@ -206,28 +356,106 @@ def init_database():
         )
         """
 
+        meta_table_sql = """
+        CREATE TABLE IF NOT EXISTS Meta (
+            key TEXT PRIMARY KEY,
+            val TEXT
+        )
+        """
+
         indexes_sql = [
             "CREATE INDEX IF NOT EXISTS idx_student_class_section ON Student(class, section)",
             "CREATE INDEX IF NOT EXISTS idx_student_name ON Student(name)",
             "CREATE INDEX IF NOT EXISTS idx_marks_student_id ON Marks(student_id)",
             "CREATE INDEX IF NOT EXISTS idx_marks_subject_id ON Marks(subject_id)",
             "CREATE INDEX IF NOT EXISTS idx_marks_assessment_date ON Marks(assessment_date)",
-            "CREATE INDEX IF NOT EXISTS idx_marks_student_subject ON Marks(student_id, subject_id)"
+            "CREATE INDEX IF NOT EXISTS idx_marks_student_subject ON Marks(student_id, subject_id)",
+            # Covering index: per-student aggregations read marks/max straight
+            # from the index without touching the table rows
+            "CREATE INDEX IF NOT EXISTS idx_marks_student_covering ON Marks(student_id, marks_obtained, max_marks)",
+            # Lets pass/fail and failing-student queries range-scan on the
+            # generated percentage instead of recomputing it per row
+            "CREATE INDEX IF NOT EXISTS idx_marks_pct ON Marks(pct)"
         ]
 
-        for table_sql in [student_table_sql, subject_table_sql, marks_table_sql]:
+        for table_sql in [student_table_sql, subject_table_sql, marks_table_sql, meta_table_sql]:
             db.execute_query(table_sql)
 
+        # Generated percentage column: computed once by SQLite instead of
+        # repeating the multiply/divide in every analytics query. Added via
+        # ALTER (guarded by a pragma probe) so existing databases pick it up;
+        # VIRTUAL because SQLite cannot ALTER in a STORED generated column.
+        # table_xinfo, not table_info: only the former lists generated columns.
+        has_pct = db.fetch_one(
+            "SELECT COUNT(*) FROM pragma_table_xinfo('Marks') WHERE name = 'pct'"
+        )
+        if not has_pct or has_pct[0] == 0:
+            db.execute_query(
+                "ALTER TABLE Marks ADD COLUMN pct REAL GENERATED ALWAYS AS "
+                "(marks_obtained * 100.0 / max_marks) VIRTUAL"
+            )
+
         for index_sql in indexes_sql:
             db.execute_query(index_sql)
 
         initialize_sample_data()
+
+        # Refresh planner statistics so the join indexes actually get picked
+        db.execute_query("ANALYZE")
         return True
 
     except Exception as e:
         st.error(f"Database initialization failed: {e}")
         return False
 
+def compact_database():
+    """Reclaim space after bulk deletes: truncate the WAL, rebuild the file,
+    and refresh planner statistics so approximate counts stay accurate"""
+    db = get_db_connection()
+    if not db:
+        return False
+
+    conn = db.pool.acquire()
+    try:
+        conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        conn.execute("VACUUM")
+        conn.execute("ANALYZE")
+        return True
+    except Exception as e:
+        st.error(f"Database compaction failed: {e}")
+        return False
+    finally:
+        db.pool.release(conn)
+
+def get_approx_counts():
+    """Approximate row counts for the header metrics from ANALYZE statistics.
+
+    sqlite_stat1 stores the estimated row count as the first integer of each
+    index's stat string, so this is one lookup on a tiny table instead of
+    three COUNT(*) scans. Returns {} when ANALYZE has not run yet."""
+    db = get_db_connection()
+    if not db:
+        return {}
+
+    has_stats = db.fetch_one(
+        "SELECT name FROM sqlite_master WHERE type = 'table' AND name = 'sqlite_stat1'"
+    )
+    if not has_stats:
+        return {}
+
+    counts = {}
+    rows = db.fetch_all(
+        "SELECT tbl, stat FROM sqlite_stat1 WHERE tbl IN ('Student', 'Subject', 'Marks')"
+    )
+    for tbl, stat in rows:
+        try:
+            estimated = int(stat.split()[0])
+        except (ValueError, IndexError):
+            continue
+        key = f"{tbl.lower()}_count"
+        counts[key] = max(counts.get(key, 0), estimated)
+    return counts
+
 def get_database_info():
     db = get_db_connection()
     if not db:
@@ -240,9 +468,21 @@ def get_database_info():
             "database_size": db.db_path.stat().st_size if db.db_path.exists() else 0
         }
 
-        for table in ["Student", "Subject", "Marks"]:
-            result = db.fetch_one(f"SELECT COUNT(*) FROM {table}")
-            info[f"{table.lower()}_count"] = result[0] if result else 0
+        # Approximate counts from planner statistics are enough for the
+        # informational header metrics; fall back to one exact round-trip
+        approx = get_approx_counts()
+        if len(approx) == 3:
+            info.update(approx)
+            return info
+
+        counts = db.fetch_one("""
+            SELECT (SELECT COUNT(*) FROM Student),
+                   (SELECT COUNT(*) FROM Subject),
+                   (SELECT COUNT(*) FROM Marks)
+        """)
+        info["student_count"] = counts[0] if counts else 0
+        info["subject_count"] = counts[1] if counts else 0
+        info["marks_count"] = counts[2] if counts else 0
 
         return info
 
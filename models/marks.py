@@ -1,11 +1,20 @@
 """
 Marks Model - CRUD operations and calculations for Marks entity (SQLite version)
 """
+import heapq
+from bisect import bisect_right
 import streamlit as st
 import pandas as pd
+import numpy as np
 from datetime import date, datetime
 from typing import List, Dict, Optional
-from db.connection import execute_query, fetch_all, fetch_one
+from db.connection import execute_query, execute_many, fetch_all, fetch_one
+
+# Grade boundaries, precomputed once so grading is a single bisect instead
+# of a branch ladder
+GRADE_THRESHOLDS = (40, 50, 60, 70, 80, 90)
+GRADE_LABELS = ('F', 'C', 'C+', 'B', 'B+', 'A', 'A+')
+_GRADE_LABEL_ARRAY = np.array(GRADE_LABELS)
 
 class Marks:
     def __init__(self, mark_id=None, student_id=None, subject_id=None,
@@ -33,18 +42,62 @@ class Marks:
         return execute_query(query, (student_id, subject_id, marks_obtained, max_marks, assessment_date, assessment_type))
 
     @staticmethod
-    def get_all_marks() -> list:
-        """Get all marks with student and subject names"""
+    def bulk_add(rows: list) -> int:
+        """Insert many marks rows in one transaction; each row is
+        (student_id, subject_id, marks_obtained, max_marks, assessment_date,
+        assessment_type)"""
         query = """
+        INSERT INTO Marks (student_id, subject_id, marks_obtained, max_marks, assessment_date, assessment_type)
+        VALUES (?, ?, ?, ?, ?, ?)
+        """
+        return execute_many(query, rows)
+
+    @staticmethod
+    def get_all_marks(class_name: str = None, section: str = None) -> list:
+        """Get all marks with student and subject names, optionally
+        restricted to a class/section so the filter runs in SQL"""
+        conditions = []
+        params = []
+        if class_name:
+            conditions.append("s.class = ?")
+            params.append(class_name)
+            if section:
+                conditions.append("s.section = ?")
+                params.append(section)
+        where_clause = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+
+        query = f"""
         SELECT m.mark_id, s.name, sub.subject_name, m.marks_obtained, m.max_marks,
                m.assessment_date, m.assessment_type, m.created_at,
                m.student_id, m.subject_id
         FROM Marks m
         JOIN Student s ON m.student_id = s.student_id
         JOIN Subject sub ON m.subject_id = sub.subject_id
+        {where_clause}
         ORDER BY m.assessment_date DESC, s.name, sub.subject_name
         """
-        return fetch_all(query)
+        return fetch_all(query, tuple(params) if params else None)
+
+    @staticmethod
+    def count() -> int:
+        """Count marks entries without fetching rows"""
+        result = fetch_one("SELECT COUNT(*) FROM Marks")
+        return result[0] if result else 0
+
+    @staticmethod
+    def recent(limit: int = 5) -> list:
+        """Get the most recently added marks via a primary-key backward scan"""
+        query = """
+        SELECT m.mark_id, s.name, sub.subject_name, m.marks_obtained, m.max_marks,
+               m.assessment_date, m.assessment_type, m.created_at,
+               m.student_id, m.subject_id
+        FROM Marks m
+        JOIN Student s ON m.student_id = s.student_id
+        JOIN Subject sub ON m.subject_id = sub.subject_id
+        ORDER BY m.mark_id DESC
+        LIMIT ?
+        """
+        return fetch_all(query, (limit,))
 
     @staticmethod
     def get_student_marks(student_id: int) -> list:
@@ -99,24 +152,24 @@ class Marks:
     @staticmethod
     def calculate_grade(percentage: float) -> str:
         """Calculate letter grade based on percentage"""
-        if percentage >= 90:
-            return "A+"
-        elif percentage >= 80:
-            return "A"
-        elif percentage >= 70:
-            return "B+"
-        elif percentage >= 60:
-            return "B"
-        elif percentage >= 50:
-            return "C+"
-        elif percentage >= 40:
-            return "C"
-        else:
-            return "F"
+        return GRADE_LABELS[bisect_right(GRADE_THRESHOLDS, percentage)]
+
+    @staticmethod
+    def calculate_grades(percentages) -> np.ndarray:
+        """Grade a whole array of percentages with one searchsorted pass
+        instead of one Python call per value"""
+        codes = np.searchsorted(GRADE_THRESHOLDS,
+                                np.asarray(percentages, dtype=np.float64),
+                                side='right')
+        return _GRADE_LABEL_ARRAY[codes]
 
     @staticmethod
     def calculate_percentage(marks_obtained: int, max_marks: int) -> float:
         """Calculate percentage from marks"""
+        if max_marks == 100:
+            # Overwhelmingly the common case: out of 100, the marks already
+            # are the percentage, so skip the division
+            return round(float(marks_obtained), 2)
         if max_marks == 0:
             return 0.0
         return round((marks_obtained / max_marks) * 100, 2)
@@ -245,8 +298,8 @@ class Marks:
         fail_count = students_with_marks - pass_count
         pass_percentage = (pass_count / students_with_marks * 100) if students_with_marks > 0 else 0
 
-        # Top 3 performers
-        top_performers = sorted(student_summaries, key=lambda x: x['percentage'], reverse=True)[:3]
+        # Top 3 performers (heap selection avoids sorting the full list)
+        top_performers = heapq.nlargest(3, student_summaries, key=lambda x: x['percentage'])
 
         return {
             'class_name': class_name,
@@ -189,6 +189,7 @@ elif action == "Delete Student":
                         if st.button("🗑️ Delete Student", type="primary"):
                             if Student.delete_student(selected_student_id):
                                 st.success(f"✅ Student {student_data[1]} deleted successfully!")
+                                st.cache_data.clear()
                                 st.rerun()
                             else:
                                 st.error("❌ Failed to delete student")
@@ -6,6 +6,7 @@ import pandas as pd
 from datetime import date
 import sys
 import os
+from collections import Counter
 
 # Add parent directory to path for imports
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -207,10 +208,9 @@ if student_id:
             # Grade Analysis
             st.markdown("### 📊 Grade Distribution")
 
-            grade_counts = {}
-            for subject in student_summary['subject_details']:
-                grade = subject['grade']
-                grade_counts[grade] = grade_counts.get(grade, 0) + 1
+            grade_counts = Counter(
+                subject['grade'] for subject in student_summary['subject_details']
+            )
 
             # Display grade distribution
             col1, col2, col3, col4 = st.columns(4)
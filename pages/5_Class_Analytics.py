@@ -3,8 +3,10 @@ Class Analytics Page - Class and section-wise performance analysis (SQLite versi
 """
 import streamlit as st
 import pandas as pd
+import heapq
 import sys
 import os
+from collections import Counter
 from datetime import date
 import sqlite3
 
@@ -179,10 +181,9 @@ with col1:
                     # Grade distribution
                     st.markdown("### 📊 Grade Distribution")
 
-                    grade_counts = {}
-                    for student in class_analytics['student_summaries']:
-                        grade = student['grade']
-                        grade_counts[grade] = grade_counts.get(grade, 0) + 1
+                    grade_counts = Counter(
+                        student['grade'] for student in class_analytics['student_summaries']
+                    )
 
                     col1_1, col1_2, col1_3, col1_4 = st.columns(4)
 
@@ -345,11 +346,11 @@ with col2:
                 total_assessments = len(class_marks)
                 st.metric("Total Assessments", total_assessments)
 
-                # Recent activity
-                recent_marks = sorted(class_marks, key=lambda x: x[7], reverse=True)[:5]
+                # Recent activity (top 5 without sorting the full list)
+                recent_marks = heapq.nlargest(5, class_marks, key=lambda x: x[7])
 
                 st.markdown("**Recent Assessments:**")
-                for mark in recent_marks[:5]:
+                for mark in recent_marks:
                     percentage = Marks.calculate_percentage(mark[3], mark[4])
                     st.write(f"• {mark[1]}: {mark[2]} ({percentage:.1f}%)")
         else:
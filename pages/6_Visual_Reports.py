@@ -3,6 +3,7 @@ Visual Reports Page - Interactive charts and visualizations
 """
 import streamlit as st
 import pandas as pd
+import numpy as np
 import altair as alt
 import plotly.express as px
 import plotly.graph_objects as go
@@ -17,10 +18,14 @@ except NameError:
     # When running as script, add current directory
     sys.path.append('.')
 
+from db.connection import fetch_one
 from models.student import Student
 from models.subject import Subject
 from models.marks import Marks
-from utils.analytics import PerformanceAnalytics
+from utils.analytics import (PerformanceAnalytics, cached_grade_distribution,
+                             cached_class_wise_performance,
+                             cached_subject_performance_comparison,
+                             cached_top_performers)
 
 st.set_page_config(
     page_title="Visual Reports",
@@ -31,11 +36,526 @@ st.set_page_config(
 st.title("Visual Reports & Analytics")
 st.markdown("Interactive charts and visualizations for performance analysis")
 
-# Check if data exists
-students = Student.get_all_students()
-marks = Marks.get_all_marks()
+# Cached data loaders - avoid re-hitting the DB on every rerun
+@st.cache_data(ttl=3600, show_spinner=False)
+def _load_students():
+    return Student.get_all_students()
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _load_marks(class_name=None, section=None):
+    return Marks.get_all_marks(class_name, section)
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _load_unique_classes():
+    return Student.get_unique_classes()
+
+# Column layout of the tuples returned by the model queries
+MARKS_COLUMNS = ['Mark_ID', 'Student', 'Subject', 'Obtained', 'Max_Marks',
+                 'Date', 'Assessment_Type', 'Created', 'Student_ID', 'Subject_ID']
+STUDENT_COLUMNS = ['Student_ID', 'Student', 'Class', 'Section', 'DOB', 'Created']
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _students_df():
+    df = pd.DataFrame(_load_students(), columns=STUDENT_COLUMNS)
+    if not df.empty:
+        # Category dtype keeps groupby/filter on these low-cardinality keys cheap
+        df['Class'] = df['Class'].astype('category')
+        df['Section'] = df['Section'].astype('category')
+        # Precompute the combined key once here instead of re-concatenating
+        # strings in every chart builder that needs it
+        df['Class_Section'] = (df['Class'].astype(str)
+                               .str.cat(df['Section'].astype(str), sep='-')
+                               .astype('category'))
+    return df
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _class_sections(selected_class):
+    """Unique sections for a class, computed vectorized from the students DataFrame"""
+    df = _students_df()
+    return sorted(df.loc[df['Class'] == selected_class, 'Section'].unique().tolist())
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _marks_df(class_filter="All", section_filter="All"):
+    """Build the marks DataFrame with vectorized derived columns; class/section
+    filters are pushed down into the SQL so unwanted rows never leave the DB"""
+    class_name = None if class_filter == "All" else class_filter
+    section = None if section_filter == "All" else section_filter
+    df = pd.DataFrame(_load_marks(class_name, section), columns=MARKS_COLUMNS)
+    if df.empty:
+        return df
+    # Vectorized percentage/status instead of per-row Marks.calculate_percentage();
+    # float32 halves the memory handed to Plotly serialization downstream
+    pct = (df['Obtained'].to_numpy(dtype=np.float32) /
+           df['Max_Marks'].to_numpy(dtype=np.float32) * 100.0)
+    df['Percentage'] = np.round(pct, 2)
+    df['Date'] = pd.to_datetime(df['Date'])
+    df['Status'] = pd.Categorical(np.where(pct >= 40, 'Pass', 'Fail'))
+    # Category dtype keeps groupby/filter on these low-cardinality keys cheap
+    df['Subject'] = df['Subject'].astype('category')
+    df['Assessment_Type'] = df['Assessment_Type'].astype('category')
+    return df
+
+@st.cache_resource
+def _layout_defaults():
+    """Shared layout options, built once per process and reused by every figure"""
+    return dict(template='plotly_white', margin=dict(l=0, r=0, t=50, b=0))
+
+@st.cache_resource
+def _colorscales():
+    """Shared color palettes, resolved once instead of per chart build"""
+    return {
+        'qualitative': px.colors.qualitative.Set3,
+        'sequential': 'Viridis',
+        'pass_fail': 'RdYlGn',
+        'risk': 'Reds',
+    }
+
+def _spec(fig):
+    """Pre-serialize a figure to its JSON spec so st.plotly_chart skips re-serialization"""
+    fig.update_layout(**_layout_defaults())
+    return fig.to_plotly_json()
+
+# Cached figure builders - memoized per (chart type, filters) so switching
+# charts back and forth reuses pre-built, pre-serialized specs instead of
+# rebuilding and re-serializing the figures
+@st.cache_data(show_spinner=False)
+def _figs_grade_distribution(class_filter, section_filter):
+    """Build pie + bar figures for the grade distribution view"""
+    grade_data = cached_grade_distribution(
+        class_filter if class_filter != "All" else None,
+        section_filter if section_filter != "All" else None
+    )
+
+    if grade_data['total_students'] == 0:
+        return None, None, grade_data
+
+    grade_counts = grade_data['grade_counts']
+
+    # Remove grades with 0 count
+    filtered_grades = {k: v for k, v in grade_counts.items() if v > 0}
+
+    if not filtered_grades:
+        return None, None, grade_data
+
+    # Create DataFrame for plotting
+    df_grades = pd.DataFrame([
+        {'Grade': grade, 'Count': count, 'Percentage': (count/grade_data['total_students'])*100}
+        for grade, count in filtered_grades.items()
+    ])
+    # Smaller dtypes mean less JSON over the wire to Plotly.js
+    df_grades['Count'] = df_grades['Count'].astype('int32')
+    df_grades['Percentage'] = df_grades['Percentage'].astype('float32')
+
+    # Pie chart using Plotly
+    fig_pie = px.pie(
+        df_grades,
+        values='Count',
+        names='Grade',
+        title=f"Grade Distribution - Total Students: {grade_data['total_students']}",
+        color_discrete_sequence=_colorscales()['qualitative']
+    )
+    fig_pie.update_traces(textposition='inside', textinfo='percent+label')
+
+    # Bar chart using Plotly
+    fig_bar = px.bar(
+        df_grades,
+        x='Grade',
+        y='Count',
+        title="Grade Distribution (Count)",
+        color='Count',
+        color_continuous_scale=_colorscales()['sequential']
+    )
+    fig_bar.update_layout(showlegend=False)
+
+    return _spec(fig_pie), _spec(fig_bar), grade_data
+
+@st.cache_data(show_spinner=False)
+def _figs_class_performance():
+    """Build the three class performance figures and the summary table"""
+    class_performance = cached_class_wise_performance()
+
+    if not class_performance:
+        return None, None, None, None
+
+    df_class = pd.DataFrame(class_performance)
+    df_class['Class-Section'] = df_class['class'].str.cat(df_class['section'], sep='-')
+    # Smaller dtypes mean less JSON over the wire to Plotly.js
+    df_class['avg_percentage'] = df_class['avg_percentage'].astype('float32')
+    df_class['pass_percentage'] = df_class['pass_percentage'].astype('float32')
+    df_class['total_students'] = df_class['total_students'].astype('int32')
+    df_class['total_assessments'] = df_class['total_assessments'].astype('int32')
+
+    # Average percentage comparison
+    fig_avg = px.bar(
+        df_class,
+        x='Class-Section',
+        y='avg_percentage',
+        title="Average Percentage by Class-Section",
+        color='avg_percentage',
+        color_continuous_scale=_colorscales()['pass_fail']
+    )
+    fig_avg.update_layout(xaxis_tickangle=-45)
+
+    # Pass percentage comparison
+    fig_pass = px.bar(
+        df_class,
+        x='Class-Section',
+        y='pass_percentage',
+        title="Pass Percentage by Class-Section",
+        color='pass_percentage',
+        color_continuous_scale='Blues'
+    )
+    fig_pass.update_layout(xaxis_tickangle=-45)
+
+    # Scatter plot: Average vs Pass percentage
+    fig_scatter = px.scatter(
+        df_class,
+        x='avg_percentage',
+        y='pass_percentage',
+        size='total_students',
+        color='class',
+        hover_name='Class-Section',
+        title="Class Performance Overview: Average % vs Pass %",
+        labels={'avg_percentage': 'Average Percentage', 'pass_percentage': 'Pass Percentage'},
+        render_mode='webgl'
+    )
+
+    display_df = df_class[['Class-Section', 'total_students', 'avg_percentage', 'pass_percentage', 'total_assessments']].copy()
+    display_df.columns = ['Class-Section', 'Students', 'Avg %', 'Pass %', 'Assessments']
+
+    return _spec(fig_avg), _spec(fig_pass), _spec(fig_scatter), display_df
+
+@st.cache_data(show_spinner=False)
+def _figs_subject_performance():
+    """Build the subject performance figures and the details table"""
+    subject_performance = cached_subject_performance_comparison()
+
+    if not subject_performance:
+        return None, None, None, None
+
+    df_subjects = pd.DataFrame(subject_performance)
+    # Smaller dtypes mean less JSON over the wire to Plotly.js
+    df_subjects['avg_percentage'] = df_subjects['avg_percentage'].astype('float32')
+    df_subjects['total_assessments'] = df_subjects['total_assessments'].astype('int32')
+
+    # Average percentage by subject
+    fig_subj_avg = px.bar(
+        df_subjects,
+        y='subject',
+        x='avg_percentage',
+        orientation='h',
+        title="Average Percentage by Subject",
+        color='avg_percentage',
+        color_continuous_scale=_colorscales()['sequential']
+    )
+    fig_subj_avg.update_layout(height=500)
+
+    # Number of assessments by subject
+    fig_subj_count = px.bar(
+        df_subjects,
+        y='subject',
+        x='total_assessments',
+        orientation='h',
+        title="Total Assessments by Subject",
+        color='total_assessments',
+        color_continuous_scale='Blues'
+    )
+    fig_subj_count.update_layout(height=500)
+
+    # Subject performance range (min to max) - one trace with None separators
+    # draws all the disjoint segments without a per-subject add_trace loop
+    range_x = np.ravel(np.column_stack([
+        df_subjects['lowest_marks'].to_numpy(dtype=np.float32),
+        df_subjects['highest_marks'].to_numpy(dtype=np.float32),
+        np.full(len(df_subjects), np.nan, dtype=np.float32)
+    ]))
+    range_y = np.ravel(np.column_stack([
+        df_subjects['subject'],
+        df_subjects['subject'],
+        df_subjects['subject']
+    ]))
+
+    fig_range = go.Figure(go.Scatter(
+        x=range_x,
+        y=range_y,
+        mode='lines+markers',
+        line=dict(width=4),
+        marker=dict(size=8)
+    ))
+
+    fig_range.update_layout(
+        title="Subject Performance Range (Min to Max Marks)",
+        xaxis_title="Marks",
+        yaxis_title="Subject",
+        showlegend=False,
+        height=500
+    )
 
-if not students or not marks:
+    display_df = df_subjects[['subject', 'total_assessments', 'avg_percentage', 'highest_marks', 'lowest_marks', 'grade']].copy()
+    display_df.columns = ['Subject', 'Assessments', 'Avg %', 'Highest', 'Lowest', 'Grade']
+
+    return _spec(fig_subj_avg), _spec(fig_subj_count), _spec(fig_range), display_df
+
+@st.cache_data(show_spinner=False)
+def _figs_top_performers(class_filter):
+    """Build the top performer figures and the leaderboard table"""
+    top_performers = cached_top_performers(
+        limit=15,
+        class_name=class_filter if class_filter != "All" else None
+    )
+
+    if not top_performers:
+        return None, None, None
+
+    df_top = pd.DataFrame(top_performers)
+    # Smaller dtypes mean less JSON over the wire to Plotly.js
+    df_top['percentage'] = df_top['percentage'].astype('float32')
+
+    # Top performers bar chart
+    fig_top = px.bar(
+        df_top.head(10),
+        y='name',
+        x='percentage',
+        orientation='h',
+        title="Top 10 Performers",
+        color='percentage',
+        color_continuous_scale=_colorscales()['pass_fail']
+    )
+    fig_top.update_layout(height=500, yaxis={'categoryorder': 'total ascending'})
+
+    # Performance by class
+    if class_filter == "All":
+        df_top['Class-Section'] = df_top['class'].str.cat(df_top['section'], sep='-')
+
+        fig_second = px.box(
+            df_top,
+            x='Class-Section',
+            y='percentage',
+            title="Performance Distribution by Class",
+            points="outliers"
+        )
+        fig_second.update_layout(xaxis_tickangle=-45, height=500)
+    else:
+        # Grade distribution for top performers
+        grade_counts = df_top['grade'].value_counts()
+
+        fig_second = px.pie(
+            values=grade_counts.values,
+            names=grade_counts.index,
+            title="Grade Distribution - Top Performers"
+        )
+
+    display_df = df_top[['rank', 'name', 'class', 'section', 'percentage', 'grade', 'total_subjects']].copy()
+    display_df.columns = ['Rank', 'Name', 'Class', 'Section', 'Percentage', 'Grade', 'Subjects']
+
+    return _spec(fig_top), _spec(fig_second), display_df
+
+_LTTB_THRESHOLD = 2000
+
+def _lttb_indices(x, y, n_out):
+    """Largest-Triangle-Three-Buckets: pick n_out visually faithful points"""
+    n = len(x)
+    if n <= n_out or n_out < 3:
+        return np.arange(n)
+    # Bucket the interior points; the first and last points are always kept
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    keep = np.empty(n_out, dtype=np.int64)
+    keep[0], keep[-1] = 0, n - 1
+    for i in range(n_out - 2):
+        lo, hi = edges[i], max(edges[i + 1], edges[i] + 1)
+        # The next bucket's average stands in for its yet-unchosen point
+        if i + 2 < n_out - 1:
+            nx = x[edges[i + 1]:edges[i + 2]].mean()
+            ny = y[edges[i + 1]:edges[i + 2]].mean()
+        else:
+            nx, ny = x[n - 1], y[n - 1]
+        ax, ay = x[keep[i]], y[keep[i]]
+        area = np.abs((ax - nx) * (y[lo:hi] - ay) - (ax - x[lo:hi]) * (ny - ay))
+        keep[i + 1] = lo + int(area.argmax())
+    return keep
+
+@st.cache_data(show_spinner=False)
+def _trend_aggregates(class_filter, section_filter):
+    """Compute the three trend aggregations once per filter combination"""
+    df_trends = _marks_df(class_filter, section_filter)
+
+    if df_trends.empty:
+        return None, None, None
+
+    df_daily_avg = (df_trends.groupby('Date', sort=False, observed=True)['Percentage']
+                    .mean().reset_index().sort_values('Date'))
+    df_assessment = (df_trends.groupby('Assessment_Type', sort=False, observed=True)['Percentage']
+                     .mean().reset_index())
+    df_subject_trend = (df_trends.groupby(['Date', 'Subject'], sort=False, observed=True)['Percentage']
+                        .mean().reset_index().sort_values('Date'))
+
+    # Means come back as float64; downcast before they reach Plotly
+    for agg in (df_daily_avg, df_assessment, df_subject_trend):
+        agg['Percentage'] = agg['Percentage'].astype('float32')
+
+    return df_daily_avg, df_assessment, df_subject_trend
+
+@st.cache_data(show_spinner=False)
+def _figs_trends(class_filter, section_filter):
+    """Build the three performance trend figures"""
+    df_daily_avg, df_assessment, df_subject_trend = _trend_aggregates(class_filter, section_filter)
+
+    if df_daily_avg is None:
+        return None, None, None
+
+    # Performance trend over time
+    fig_trend = px.line(
+        df_daily_avg,
+        x='Date',
+        y='Percentage',
+        title="Average Performance Trend Over Time",
+        markers=True
+    )
+    fig_trend.add_hline(y=40, line_dash="dash", line_color="red",
+                        annotation_text="Pass Threshold (40%)")
+
+    # Performance by assessment type
+    fig_assessment = px.bar(
+        df_assessment,
+        x='Assessment_Type',
+        y='Percentage',
+        title="Average Performance by Assessment Type",
+        color='Percentage',
+        color_continuous_scale=_colorscales()['sequential']
+    )
+
+    # Subject performance trend; downsample dense lines so Plotly.js stays responsive
+    if len(df_subject_trend) > _LTTB_THRESHOLD:
+        sampled = []
+        for _, grp in df_subject_trend.groupby('Subject', sort=False, observed=True):
+            if len(grp) > _LTTB_THRESHOLD:
+                idx = _lttb_indices(grp['Date'].astype('int64').to_numpy(),
+                                    grp['Percentage'].to_numpy(dtype=np.float64),
+                                    _LTTB_THRESHOLD)
+                grp = grp.iloc[idx]
+            sampled.append(grp)
+        df_subject_trend = pd.concat(sampled).sort_values('Date')
+
+    fig_subject_trend = px.line(
+        df_subject_trend,
+        x='Date',
+        y='Percentage',
+        color='Subject',
+        title="Subject-wise Performance Trends",
+        render_mode='webgl'
+    )
+
+    return _spec(fig_trend), _spec(fig_assessment), _spec(fig_subject_trend)
+
+def _group_pass_rates(keys, is_pass):
+    """Pass rate per group in one C pass: bincount totals and passes over the
+    category codes, then divide - no crosstab/unstack intermediates"""
+    codes = keys.cat.codes.to_numpy()
+    valid = codes >= 0
+    if not valid.all():
+        codes = codes[valid]
+        is_pass = is_pass[valid]
+    n_groups = len(keys.cat.categories)
+    totals = np.bincount(codes, minlength=n_groups)
+    passes = np.bincount(codes, weights=is_pass, minlength=n_groups)
+    observed = totals > 0
+    rates = (passes[observed] / totals[observed] * 100.0).astype(np.float32)
+    return pd.DataFrame({keys.name: keys.cat.categories[observed],
+                         'Pass_Rate': rates})
+
+@st.cache_data(show_spinner=False)
+def _figs_pass_fail(class_filter, section_filter):
+    """Build the pass/fail figures and the at-risk students table"""
+    df_pass_fail = _marks_df(class_filter, section_filter)
+
+    if df_pass_fail.empty:
+        return None, None, None, None, None
+
+    # Attach class/section via a single merge instead of a per-mark linear scan
+    df_pass_fail = df_pass_fail.merge(
+        _students_df()[['Student_ID', 'Class', 'Section', 'Class_Section']],
+        on='Student_ID',
+        how='left'
+    )
+
+    # Overall pass/fail ratio
+    status_counts = df_pass_fail['Status'].value_counts()
+
+    fig_pass_fail = px.pie(
+        values=status_counts.values,
+        names=status_counts.index,
+        title="Overall Pass/Fail Ratio",
+        color_discrete_map={'Pass': 'green', 'Fail': 'red'}
+    )
+
+    # Pass rate by subject - single bincount reduction over category codes
+    is_pass = (df_pass_fail['Status'] == 'Pass').to_numpy(dtype=np.float64)
+    subject_pass_rate = _group_pass_rates(df_pass_fail['Subject'], is_pass)
+
+    fig_subject_pass = px.bar(
+        subject_pass_rate,
+        x='Subject',
+        y='Pass_Rate',
+        title="Pass Rate by Subject",
+        color='Pass_Rate',
+        color_continuous_scale=_colorscales()['pass_fail']
+    )
+    fig_subject_pass.update_layout(xaxis_tickangle=-45)
+
+    # Class-wise pass/fail analysis (if showing all classes)
+    fig_class_pass = None
+    if class_filter == "All":
+        class_pass_fail = (_group_pass_rates(df_pass_fail['Class_Section'], is_pass)
+                           .rename(columns={'Class_Section': 'Class-Section'}))
+
+        fig_class_pass = px.bar(
+            class_pass_fail,
+            x='Class-Section',
+            y='Pass_Rate',
+            title="Pass Rate by Class-Section",
+            color='Pass_Rate',
+            color_continuous_scale=_colorscales()['pass_fail']
+        )
+        fig_class_pass.update_layout(xaxis_tickangle=-45)
+
+    # Students at risk (consistently failing)
+    fig_at_risk = None
+    at_risk_students = None
+    # Single C-level pass: sum an int8 fail flag per student instead of
+    # materializing a filtered copy and value_counts over it
+    df_pass_fail['Failed'] = (df_pass_fail['Percentage'] < 40).to_numpy(dtype=np.int8)
+    student_fail_count = (df_pass_fail.groupby('Student', observed=True)['Failed']
+                          .sum().nlargest(10))
+    student_fail_count = student_fail_count[student_fail_count > 0]
+
+    if not student_fail_count.empty:
+        at_risk_students = student_fail_count.reset_index()
+        at_risk_students.columns = ['Student', 'Failed_Assessments']
+        at_risk_students['Failed_Assessments'] = at_risk_students['Failed_Assessments'].astype('int32')
+
+        fig_at_risk = px.bar(
+            at_risk_students,
+            x='Student',
+            y='Failed_Assessments',
+            title="Students with Most Failed Assessments",
+            color='Failed_Assessments',
+            color_continuous_scale=_colorscales()['risk']
+        )
+        fig_at_risk.update_layout(xaxis_tickangle=-45)
+
+    return (_spec(fig_pass_fail), _spec(fig_subject_pass),
+            _spec(fig_class_pass) if fig_class_pass is not None else None,
+            _spec(fig_at_risk) if fig_at_risk is not None else None,
+            at_risk_students)
+
+# Check if data exists with a cheap existence probe; the full student/marks
+# tables are only loaded by the chart branch that actually needs them
+@st.cache_data(ttl=3600, show_spinner=False)
+def _has_data():
+    row = fetch_one("SELECT EXISTS(SELECT 1 FROM Student), EXISTS(SELECT 1 FROM Marks)")
+    return bool(row and row[0] and row[1])
+
+if not _has_data():
     st.warning("Insufficient data for visualization. Please add students and marks first.")
     col1, col2 = st.columns(2)
     with col1:
@@ -55,7 +575,7 @@ with st.sidebar:
         [
             "Grade Distribution",
             "Class Performance",
-            "Subject Performance", 
+            "Subject Performance",
             "Top Performers",
             "Performance Trends",
             "Pass/Fail Analysis"
@@ -67,7 +587,7 @@ with st.sidebar:
     st.subheader("Filters")
 
     # Class filter
-    unique_classes = Student.get_unique_classes()
+    unique_classes = _load_unique_classes()
     selected_class = st.selectbox(
         "Class Filter:",
         options=["All"] + unique_classes
@@ -75,11 +595,7 @@ with st.sidebar:
 
     # Section filter
     if selected_class != "All":
-        class_sections = []
-        for student in students:
-            if student[2] == selected_class and student[3] not in class_sections:
-                class_sections.append(student[3])
-        class_sections.sort()
+        class_sections = _class_sections(selected_class)
 
         selected_section = st.selectbox(
             "Section Filter:",
@@ -88,81 +604,52 @@ with st.sidebar:
     else:
         selected_section = "All"
 
-# Main content area
-if chart_type == "Grade Distribution":
+    # Cache control
+    st.markdown("---")
+    if st.button("🔄 Refresh Data", use_container_width=True):
+        st.cache_data.clear()
+        st.rerun()
+
+# Chart renderers - wrapped in st.fragment so in-chart interactions
+# rerun just the fragment, not the whole page
+@st.fragment
+def _render_grade_distribution():
     st.subheader("Grade Distribution Analysis")
 
     try:
-        # Get grade distribution data
-        if selected_class != "All":
-            grade_data = PerformanceAnalytics.get_grade_distribution(
-                selected_class, 
-                selected_section if selected_section != "All" else None
-            )
-        else:
-            grade_data = PerformanceAnalytics.get_grade_distribution()
+        fig_pie, fig_bar, grade_data = _figs_grade_distribution(selected_class, selected_section)
 
-        if grade_data['total_students'] > 0:
-            # Prepare data for visualization
+        if fig_pie is not None:
             grade_counts = grade_data['grade_counts']
 
-            # Remove grades with 0 count
-            filtered_grades = {k: v for k, v in grade_counts.items() if v > 0}
-
-            if filtered_grades:
-                # Create DataFrame for plotting
-                df_grades = pd.DataFrame([
-                    {'Grade': grade, 'Count': count, 'Percentage': (count/grade_data['total_students'])*100}
-                    for grade, count in filtered_grades.items()
-                ])
-
-                col1, col2 = st.columns(2)
-
-                with col1:
-                    # Pie chart using Plotly
-                    fig_pie = px.pie(
-                        df_grades, 
-                        values='Count', 
-                        names='Grade',
-                        title=f"Grade Distribution - Total Students: {grade_data['total_students']}",
-                        color_discrete_sequence=px.colors.qualitative.Set3
-                    )
-                    fig_pie.update_traces(textposition='inside', textinfo='percent+label')
-                    st.plotly_chart(fig_pie, use_container_width=True)
-
-                with col2:
-                    # Bar chart using Plotly
-                    fig_bar = px.bar(
-                        df_grades,
-                        x='Grade',
-                        y='Count',
-                        title="Grade Distribution (Count)",
-                        color='Count',
-                        color_continuous_scale='Viridis'
-                    )
-                    fig_bar.update_layout(showlegend=False)
-                    st.plotly_chart(fig_bar, use_container_width=True)
-
-                # Summary statistics
-                st.markdown("### Grade Summary")
-
-                col1, col2, col3, col4 = st.columns(4)
-
-                with col1:
-                    a_grades = grade_counts.get('A+', 0) + grade_counts.get('A', 0)
-                    st.metric("A Grades", a_grades, f"{(a_grades/grade_data['total_students']*100):.1f}%")
-
-                with col2:
-                    b_grades = grade_counts.get('B+', 0) + grade_counts.get('B', 0)
-                    st.metric("B Grades", b_grades, f"{(b_grades/grade_data['total_students']*100):.1f}%")
-
-                with col3:
-                    c_grades = grade_counts.get('C+', 0) + grade_counts.get('C', 0)
-                    st.metric("C Grades", c_grades, f"{(c_grades/grade_data['total_students']*100):.1f}%")
-
-                with col4:
-                    f_grades = grade_counts.get('F', 0)
-                    st.metric("F Grades", f_grades, f"{(f_grades/grade_data['total_students']*100):.1f}%")
+            col1, col2 = st.columns(2)
+
+            with col1:
+                st.plotly_chart(fig_pie, use_container_width=True)
+
+            with col2:
+                st.plotly_chart(fig_bar, use_container_width=True)
+
+            # Summary statistics
+            st.markdown("### Grade Summary")
+
+            col1, col2, col3, col4 = st.columns(4)
+
+            with col1:
+                a_grades = grade_counts.get('A+', 0) + grade_counts.get('A', 0)
+                st.metric("A Grades", a_grades, f"{(a_grades/grade_data['total_students']*100):.1f}%")
+
+            with col2:
+                b_grades = grade_counts.get('B+', 0) + grade_counts.get('B', 0)
+                st.metric("B Grades", b_grades, f"{(b_grades/grade_data['total_students']*100):.1f}%")
+
+            with col3:
+                c_grades = grade_counts.get('C+', 0) + grade_counts.get('C', 0)
+                st.metric("C Grades", c_grades, f"{(c_grades/grade_data['total_students']*100):.1f}%")
+
+            with col4:
+                f_grades = grade_counts.get('F', 0)
+                st.metric("F Grades", f_grades, f"{(f_grades/grade_data['total_students']*100):.1f}%")
 
         else:
             st.info("No grade data available for the selected filters")
@@ -170,64 +657,27 @@ if chart_type == "Grade Distribution":
     except Exception as e:
         st.error(f"Error creating grade distribution chart: {str(e)}")
 
-elif chart_type == "Class Performance":
+@st.fragment
+def _render_class_performance():
     st.subheader("🏫 Class Performance Comparison")
 
     try:
-        class_performance = PerformanceAnalytics.get_class_wise_performance()
-
-        if class_performance:
-            # Create DataFrame
-            df_class = pd.DataFrame(class_performance)
-            df_class['Class-Section'] = df_class['class'] + '-' + df_class['section']
+        fig_avg, fig_pass, fig_scatter, display_df = _figs_class_performance()
 
+        if fig_avg is not None:
             col1, col2 = st.columns(2)
 
             with col1:
-                # Average percentage comparison
-                fig_avg = px.bar(
-                    df_class,
-                    x='Class-Section',
-                    y='avg_percentage',
-                    title="Average Percentage by Class-Section",
-                    color='avg_percentage',
-                    color_continuous_scale='RdYlGn'
-                )
-                fig_avg.update_layout(xaxis_tickangle=-45)
                 st.plotly_chart(fig_avg, use_container_width=True)
 
             with col2:
-                # Pass percentage comparison
-                fig_pass = px.bar(
-                    df_class,
-                    x='Class-Section',
-                    y='pass_percentage',
-                    title="Pass Percentage by Class-Section",
-                    color='pass_percentage',
-                    color_continuous_scale='Blues'
-                )
-                fig_pass.update_layout(xaxis_tickangle=-45)
                 st.plotly_chart(fig_pass, use_container_width=True)
 
-            # Scatter plot: Average vs Pass percentage
-            fig_scatter = px.scatter(
-                df_class,
-                x='avg_percentage',
-                y='pass_percentage',
-                size='total_students',
-                color='class',
-                hover_name='Class-Section',
-                title="Class Performance Overview: Average % vs Pass %",
-                labels={'avg_percentage': 'Average Percentage', 'pass_percentage': 'Pass Percentage'}
-            )
             st.plotly_chart(fig_scatter, use_container_width=True)
 
             # Performance table
             st.markdown("### 📊 Detailed Class Performance")
 
-            display_df = df_class[['Class-Section', 'total_students', 'avg_percentage', 'pass_percentage', 'total_assessments']]
-            display_df.columns = ['Class-Section', 'Students', 'Avg %', 'Pass %', 'Assessments']
-
             st.dataframe(
                 display_df,
                 use_container_width=True,
@@ -240,75 +690,27 @@ elif chart_type == "Class Performance":
     except Exception as e:
         st.error(f"Error creating class performance charts: {str(e)}")
 
-elif chart_type == "Subject Performance":
+@st.fragment
+def _render_subject_performance():
     st.subheader("📚 Subject Performance Analysis")
 
     try:
-        subject_performance = PerformanceAnalytics.get_subject_performance_comparison()
-
-        if subject_performance:
-            # Create DataFrame
-            df_subjects = pd.DataFrame(subject_performance)
+        fig_subj_avg, fig_subj_count, fig_range, display_df = _figs_subject_performance()
 
+        if fig_subj_avg is not None:
             col1, col2 = st.columns(2)
 
             with col1:
-                # Average percentage by subject
-                fig_subj_avg = px.bar(
-                    df_subjects,
-                    y='subject',
-                    x='avg_percentage',
-                    orientation='h',
-                    title="Average Percentage by Subject",
-                    color='avg_percentage',
-                    color_continuous_scale='Viridis'
-                )
-                fig_subj_avg.update_layout(height=500)
                 st.plotly_chart(fig_subj_avg, use_container_width=True)
 
             with col2:
-                # Number of assessments by subject
-                fig_subj_count = px.bar(
-                    df_subjects,
-                    y='subject',
-                    x='total_assessments',
-                    orientation='h',
-                    title="Total Assessments by Subject",
-                    color='total_assessments',
-                    color_continuous_scale='Blues'
-                )
-                fig_subj_count.update_layout(height=500)
                 st.plotly_chart(fig_subj_count, use_container_width=True)
 
-            # Subject performance range (min to max)
-            fig_range = go.Figure()
-
-            for _, subject in df_subjects.iterrows():
-                fig_range.add_trace(go.Scatter(
-                    x=[subject['lowest_marks'], subject['highest_marks']],
-                    y=[subject['subject'], subject['subject']],
-                    mode='lines+markers',
-                    name=subject['subject'],
-                    line=dict(width=4),
-                    marker=dict(size=8)
-                ))
-
-            fig_range.update_layout(
-                title="Subject Performance Range (Min to Max Marks)",
-                xaxis_title="Marks",
-                yaxis_title="Subject",
-                showlegend=False,
-                height=500
-            )
-
             st.plotly_chart(fig_range, use_container_width=True)
 
             # Subject performance table
             st.markdown("### 📊 Subject Performance Details")
 
-            display_df = df_subjects[['subject', 'total_assessments', 'avg_percentage', 'highest_marks', 'lowest_marks', 'grade']]
-            display_df.columns = ['Subject', 'Assessments', 'Avg %', 'Highest', 'Lowest', 'Grade']
-
             st.dataframe(
                 display_df,
                 use_container_width=True,
@@ -321,83 +723,37 @@ elif chart_type == "Subject Performance":
     except Exception as e:
         st.error(f"Error creating subject performance charts: {str(e)}")
 
-elif chart_type == "Top Performers":
+def _medal_styles(display_df):
+    """Vectorized medal highlighting for the leaderboard: one np.where pass
+    per column instead of a Python callback per row"""
+    ranks = display_df['Rank'].to_numpy()
+    colors = np.where(ranks == 1, 'background-color: gold',
+             np.where(ranks == 2, 'background-color: silver',
+             np.where(ranks == 3, 'background-color: #CD7F32', '')))
+    return pd.DataFrame({col: colors for col in display_df.columns},
+                        index=display_df.index)
+
+@st.fragment
+def _render_top_performers():
     st.subheader("🏆 Top Performers Analysis")
 
     try:
-        # Get top performers data
-        if selected_class != "All":
-            top_performers = PerformanceAnalytics.get_top_performers(
-                limit=15, 
-                class_name=selected_class
-            )
-        else:
-            top_performers = PerformanceAnalytics.get_top_performers(limit=15)
-
-        if top_performers:
-            # Create DataFrame
-            df_top = pd.DataFrame(top_performers)
+        fig_top, fig_second, display_df = _figs_top_performers(selected_class)
 
+        if fig_top is not None:
             col1, col2 = st.columns(2)
 
             with col1:
-                # Top performers bar chart
-                fig_top = px.bar(
-                    df_top.head(10),
-                    y='name',
-                    x='percentage',
-                    orientation='h',
-                    title="Top 10 Performers",
-                    color='percentage',
-                    color_continuous_scale='RdYlGn'
-                )
-                fig_top.update_layout(height=500, yaxis={'categoryorder':'total ascending'})
                 st.plotly_chart(fig_top, use_container_width=True)
 
             with col2:
-                # Performance by class
-                if selected_class == "All":
-                    df_top['Class-Section'] = df_top['class'] + '-' + df_top['section']
-
-                    fig_class_perf = px.box(
-                        df_top,
-                        x='Class-Section',
-                        y='percentage',
-                        title="Performance Distribution by Class",
-                        points="all"
-                    )
-                    fig_class_perf.update_layout(xaxis_tickangle=-45, height=500)
-                    st.plotly_chart(fig_class_perf, use_container_width=True)
-                else:
-                    # Grade distribution for top performers
-                    grade_counts = df_top['grade'].value_counts()
-
-                    fig_grade_top = px.pie(
-                        values=grade_counts.values,
-                        names=grade_counts.index,
-                        title="Grade Distribution - Top Performers"
-                    )
-                    st.plotly_chart(fig_grade_top, use_container_width=True)
+                st.plotly_chart(fig_second, use_container_width=True)
 
             # Leaderboard table
             st.markdown("### 🥇 Leaderboard")
 
-            display_df = df_top[['rank', 'name', 'class', 'section', 'percentage', 'grade', 'total_subjects']]
-            display_df.columns = ['Rank', 'Name', 'Class', 'Section', 'Percentage', 'Grade', 'Subjects']
-
-            # Color code the rows based on rank
-            def highlight_rank(row):
-                if row['Rank'] == 1:
-                    return ['background-color: gold'] * len(row)
-                elif row['Rank'] == 2:
-                    return ['background-color: silver'] * len(row)
-                elif row['Rank'] == 3:
-                    return ['background-color: #CD7F32'] * len(row)  # Bronze
-                else:
-                    return [''] * len(row)
-
             st.dataframe(
-                display_df,
+                display_df.style.apply(_medal_styles, axis=None),
                 use_container_width=True,
                 hide_index=True
             )
@@ -408,212 +764,77 @@ elif chart_type == "Top Performers":
     except Exception as e:
         st.error(f"Error creating top performers charts: {str(e)}")
 
-elif chart_type == "Performance Trends":
+@st.fragment
+def _render_performance_trends():
     st.subheader("📈 Performance Trends")
 
     try:
-        # Get all marks with dates
-        all_marks = Marks.get_all_marks()
-
-        if all_marks:
-            # Create DataFrame for trend analysis
-            trend_data = []
-            for mark in all_marks:
-                percentage = Marks.calculate_percentage(mark[3], mark[4])
-                trend_data.append({
-                    'Date': mark[5],
-                    'Student': mark[1],
-                    'Subject': mark[2],
-                    'Percentage': percentage,
-                    'Assessment_Type': mark[6]
-                })
-
-            df_trends = pd.DataFrame(trend_data)
-            df_trends['Date'] = pd.to_datetime(df_trends['Date'])
-
-            # Apply filters
-            if selected_class != "All":
-                # Filter by class
-                class_students = [s[1] for s in students if s[2] == selected_class]
-                if selected_section != "All":
-                    class_students = [s[1] for s in students if s[2] == selected_class and s[3] == selected_section]
-
-                df_trends = df_trends[df_trends['Student'].isin(class_students)]
-
-            if not df_trends.empty:
-                col1, col2 = st.columns(2)
-
-                with col1:
-                    # Performance trend over time
-                    df_daily_avg = df_trends.groupby('Date')['Percentage'].mean().reset_index()
-
-                    fig_trend = px.line(
-                        df_daily_avg,
-                        x='Date',
-                        y='Percentage',
-                        title="Average Performance Trend Over Time",
-                        markers=True
-                    )
-                    fig_trend.add_hline(y=40, line_dash="dash", line_color="red", 
-                                      annotation_text="Pass Threshold (40%)")
-                    st.plotly_chart(fig_trend, use_container_width=True)
-
-                with col2:
-                    # Performance by assessment type
-                    df_assessment = df_trends.groupby('Assessment_Type')['Percentage'].mean().reset_index()
-
-                    fig_assessment = px.bar(
-                        df_assessment,
-                        x='Assessment_Type',
-                        y='Percentage',
-                        title="Average Performance by Assessment Type",
-                        color='Percentage',
-                        color_continuous_scale='Viridis'
-                    )
-                    st.plotly_chart(fig_assessment, use_container_width=True)
-
-                # Subject performance trend
-                df_subject_trend = df_trends.groupby(['Date', 'Subject'])['Percentage'].mean().reset_index()
-
-                fig_subject_trend = px.line(
-                    df_subject_trend,
-                    x='Date',
-                    y='Percentage',
-                    color='Subject',
-                    title="Subject-wise Performance Trends"
-                )
-                st.plotly_chart(fig_subject_trend, use_container_width=True)
-
-            else:
-                st.info("No trend data available for selected filters")
+        fig_trend, fig_assessment, fig_subject_trend = _figs_trends(selected_class, selected_section)
+
+        if fig_trend is not None:
+            col1, col2 = st.columns(2)
+
+            with col1:
+                st.plotly_chart(fig_trend, use_container_width=True)
+
+            with col2:
+                st.plotly_chart(fig_assessment, use_container_width=True)
+
+            st.plotly_chart(fig_subject_trend, use_container_width=True)
 
         else:
-            st.info("No marks data available for trend analysis")
+            st.info("No trend data available for selected filters")
 
     except Exception as e:
         st.error(f"Error creating performance trend charts: {str(e)}")
 
-elif chart_type == "Pass/Fail Analysis":
+@st.fragment
+def _render_pass_fail_analysis():
     st.subheader("✅❌ Pass/Fail Analysis")
 
     try:
-        # Get pass/fail data
-        all_marks = Marks.get_all_marks()
-
-        if all_marks:
-            pass_fail_data = []
-
-            for mark in all_marks:
-                percentage = Marks.calculate_percentage(mark[3], mark[4])
-                status = "Pass" if percentage >= 40 else "Fail"
-
-                # Get student info
-                student_info = next((s for s in students if s[0] == mark[8]), None)
-
-                pass_fail_data.append({
-                    'Student': mark[1],
-                    'Subject': mark[2],
-                    'Percentage': percentage,
-                    'Status': status,
-                    'Class': student_info[2] if student_info else 'Unknown',
-                    'Section': student_info[3] if student_info else 'Unknown',
-                    'Assessment_Type': mark[6]
-                })
-
-            df_pass_fail = pd.DataFrame(pass_fail_data)
-
-            # Apply filters
-            if selected_class != "All":
-                df_pass_fail = df_pass_fail[df_pass_fail['Class'] == selected_class]
-                if selected_section != "All":
-                    df_pass_fail = df_pass_fail[df_pass_fail['Section'] == selected_section]
-
-            if not df_pass_fail.empty:
-                col1, col2 = st.columns(2)
-
-                with col1:
-                    # Overall pass/fail ratio
-                    status_counts = df_pass_fail['Status'].value_counts()
-
-                    fig_pass_fail = px.pie(
-                        values=status_counts.values,
-                        names=status_counts.index,
-                        title="Overall Pass/Fail Ratio",
-                        color_discrete_map={'Pass': 'green', 'Fail': 'red'}
-                    )
-                    st.plotly_chart(fig_pass_fail, use_container_width=True)
-
-                with col2:
-                    # Pass rate by subject
-                    subject_pass_rate = df_pass_fail.groupby(['Subject', 'Status']).size().unstack(fill_value=0)
-                    subject_pass_rate['Pass_Rate'] = (subject_pass_rate.get('Pass', 0) / 
-                                                    (subject_pass_rate.get('Pass', 0) + subject_pass_rate.get('Fail', 0))) * 100
-
-                    subject_pass_rate = subject_pass_rate.reset_index()
-
-                    fig_subject_pass = px.bar(
-                        subject_pass_rate,
-                        x='Subject',
-                        y='Pass_Rate',
-                        title="Pass Rate by Subject",
-                        color='Pass_Rate',
-                        color_continuous_scale='RdYlGn'
-                    )
-                    fig_subject_pass.update_layout(xaxis_tickangle=-45)
-                    st.plotly_chart(fig_subject_pass, use_container_width=True)
-
-                # Class-wise pass/fail analysis (if showing all classes)
-                if selected_class == "All":
-                    class_pass_fail = df_pass_fail.groupby(['Class', 'Section', 'Status']).size().unstack(fill_value=0)
-                    class_pass_fail['Pass_Rate'] = (class_pass_fail.get('Pass', 0) / 
-                                                   (class_pass_fail.get('Pass', 0) + class_pass_fail.get('Fail', 0))) * 100
-
-                    class_pass_fail = class_pass_fail.reset_index()
-                    class_pass_fail['Class-Section'] = class_pass_fail['Class'] + '-' + class_pass_fail['Section']
-
-                    fig_class_pass = px.bar(
-                        class_pass_fail,
-                        x='Class-Section',
-                        y='Pass_Rate',
-                        title="Pass Rate by Class-Section",
-                        color='Pass_Rate',
-                        color_continuous_scale='RdYlGn'
-                    )
-                    fig_class_pass.update_layout(xaxis_tickangle=-45)
-                    st.plotly_chart(fig_class_pass, use_container_width=True)
-
-                # Students at risk (consistently failing)
-                student_fail_count = df_pass_fail[df_pass_fail['Status'] == 'Fail']['Student'].value_counts()
-
-                if not student_fail_count.empty:
-                    st.markdown("### ⚠️ Students at Risk (Multiple Failures)")
-
-                    at_risk_students = student_fail_count.head(10).reset_index()
-                    at_risk_students.columns = ['Student', 'Failed_Assessments']
-
-                    fig_at_risk = px.bar(
-                        at_risk_students,
-                        x='Student',
-                        y='Failed_Assessments',
-                        title="Students with Most Failed Assessments",
-                        color='Failed_Assessments',
-                        color_continuous_scale='Reds'
-                    )
-                    fig_at_risk.update_layout(xaxis_tickangle=-45)
-                    st.plotly_chart(fig_at_risk, use_container_width=True)
-
-                    # Display table
-                    st.dataframe(at_risk_students, use_container_width=True, hide_index=True)
-
-            else:
-                st.info("No pass/fail data available for selected filters")
+        fig_pass_fail, fig_subject_pass, fig_class_pass, fig_at_risk, at_risk_students = _figs_pass_fail(
+            selected_class, selected_section
+        )
+
+        if fig_pass_fail is not None:
+            col1, col2 = st.columns(2)
+
+            with col1:
+                st.plotly_chart(fig_pass_fail, use_container_width=True)
+
+            with col2:
+                st.plotly_chart(fig_subject_pass, use_container_width=True)
+
+            if fig_class_pass is not None:
+                st.plotly_chart(fig_class_pass, use_container_width=True)
+
+            if fig_at_risk is not None:
+                st.markdown("### ⚠️ Students at Risk (Multiple Failures)")
+
+                st.plotly_chart(fig_at_risk, use_container_width=True)
+
+                # Display table
+                st.dataframe(at_risk_students, use_container_width=True, hide_index=True)
 
         else:
-            st.info("No marks data available for pass/fail analysis")
+            st.info("No pass/fail data available for selected filters")
 
     except Exception as e:
         st.error(f"Error creating pass/fail analysis: {str(e)}")
 
+_CHART_RENDERERS = {
+    "Grade Distribution": _render_grade_distribution,
+    "Class Performance": _render_class_performance,
+    "Subject Performance": _render_subject_performance,
+    "Top Performers": _render_top_performers,
+    "Performance Trends": _render_performance_trends,
+    "Pass/Fail Analysis": _render_pass_fail_analysis,
+}
+
+# Render the selected chart; the fragment scopes reruns to this subtree
+_CHART_RENDERERS[chart_type]()
+
 # Export section
 st.markdown("---")
 st.markdown("### 📥 Export Charts")
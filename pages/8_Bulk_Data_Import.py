@@ -1,553 +1,713 @@
-"""
-Bulk Data Import Page - Import Excel/CSV files for students, subjects, and marks
-"""
-import streamlit as st
-import pandas as pd
-import numpy as np
-from datetime import date, datetime
-import sys
-import os
-import io
-
-# Add parent directory to path for imports
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
-from models.student import Student
-from models.subject import Subject
-from models.marks import Marks
-
-st.set_page_config(
-    page_title="Bulk Data Import",
-    page_icon="📥",
-    layout="wide"
-)
-
-st.title("📥 Bulk Data Import")
-st.markdown("Import student, subject, and marks data from Excel or CSV files")
-
-# Sidebar for navigation
-with st.sidebar:
-    st.subheader("Import Options")
-    import_type = st.radio(
-        "Choose Data Type:",
-        ["Students", "Subjects", "Marks"],
-        key="import_type"
-    )
-    
-    st.markdown("---")
-    st.markdown("### 📋 File Requirements")
-    
-    if import_type == "Students":
-        st.markdown("""
-        **Students CSV/Excel Format:**
-        - Name (required)
-        - Class (required)
-        - Section (required)
-        - DOB (YYYY-MM-DD format)
-        """)
-    elif import_type == "Subjects":
-        st.markdown("""
-        **Subjects CSV/Excel Format:**
-        - Subject Name (required)
-        """)
-    elif import_type == "Marks":
-        st.markdown("""
-        **Marks CSV/Excel Format:**
-        - Student ID (required)
-        - Subject ID (required)
-        - Marks Obtained (required)
-        - Max Marks (required)
-        - Assessment Date (YYYY-MM-DD format)
-        - Assessment Type (optional)
-        """)
-
-def validate_student_data(df):
-    """Validate student data from DataFrame"""
-    errors = []
-    warnings = []
-    
-    # Check required columns
-    required_columns = ['Name', 'Class', 'Section']
-    missing_columns = [col for col in required_columns if col not in df.columns]
-    if missing_columns:
-        errors.append(f"Missing required columns: {', '.join(missing_columns)}")
-        return False, errors, warnings
-    
-    # Validate data types and values
-    for index, row in df.iterrows():
-        row_num = index + 2  # Excel rows start from 2 (1 is header)
-        
-        # Check name
-        if pd.isna(row['Name']) or str(row['Name']).strip() == '':
-            errors.append(f"Row {row_num}: Name is required")
-        
-        # Check class
-        if pd.isna(row['Class']) or str(row['Class']).strip() == '':
-            errors.append(f"Row {row_num}: Class is required")
-        elif str(row['Class']) not in ['10', '11', '12']:
-            errors.append(f"Row {row_num}: Class must be 10, 11, or 12")
-        
-        # Check section
-        if pd.isna(row['Section']) or str(row['Section']).strip() == '':
-            errors.append(f"Row {row_num}: Section is required")
-        elif str(row['Section']) not in ['A', 'B', 'C']:
-            errors.append(f"Row {row_num}: Section must be A, B, or C")
-        
-        # Check DOB if present
-        if 'DOB' in df.columns and not pd.isna(row['DOB']):
-            try:
-                if isinstance(row['DOB'], str):
-                    datetime.strptime(row['DOB'], '%Y-%m-%d')
-                elif isinstance(row['DOB'], datetime):
-                    pass  # Already a datetime object
-                else:
-                    errors.append(f"Row {row_num}: Invalid DOB format. Use YYYY-MM-DD")
-            except ValueError:
-                errors.append(f"Row {row_num}: Invalid DOB format. Use YYYY-MM-DD")
-    
-    return len(errors) == 0, errors, warnings
-
-def validate_subject_data(df):
-    """Validate subject data from DataFrame"""
-    errors = []
-    warnings = []
-    
-    # Check required columns
-    if 'Subject Name' not in df.columns:
-        errors.append("Missing required column: Subject Name")
-        return False, errors, warnings
-    
-    # Validate data
-    for index, row in df.iterrows():
-        row_num = index + 2
-        
-        if pd.isna(row['Subject Name']) or str(row['Subject Name']).strip() == '':
-            errors.append(f"Row {row_num}: Subject Name is required")
-        elif len(str(row['Subject Name']).strip()) < 2:
-            errors.append(f"Row {row_num}: Subject Name must be at least 2 characters")
-        elif len(str(row['Subject Name']).strip()) > 50:
-            errors.append(f"Row {row_num}: Subject Name must be less than 50 characters")
-    
-    return len(errors) == 0, errors, warnings
-
-def validate_marks_data(df):
-    """Validate marks data from DataFrame"""
-    errors = []
-    warnings = []
-    
-    # Check required columns
-    required_columns = ['Student ID', 'Subject ID', 'Marks Obtained', 'Max Marks']
-    missing_columns = [col for col in required_columns if col not in df.columns]
-    if missing_columns:
-        errors.append(f"Missing required columns: {', '.join(missing_columns)}")
-        return False, errors, warnings
-    
-    # Validate data
-    for index, row in df.iterrows():
-        row_num = index + 2
-        
-        # Check Student ID
-        if pd.isna(row['Student ID']):
-            errors.append(f"Row {row_num}: Student ID is required")
-        else:
-            try:
-                student_id = int(row['Student ID'])
-                # Check if student exists
-                student = Student.get_student_by_id(student_id)
-                if not student:
-                    errors.append(f"Row {row_num}: Student ID {student_id} does not exist")
-            except ValueError:
-                errors.append(f"Row {row_num}: Student ID must be a number")
-        
-        # Check Subject ID
-        if pd.isna(row['Subject ID']):
-            errors.append(f"Row {row_num}: Subject ID is required")
-        else:
-            try:
-                subject_id = int(row['Subject ID'])
-                # Check if subject exists
-                subject = Subject.get_subject_by_id(subject_id)
-                if not subject:
-                    errors.append(f"Row {row_num}: Subject ID {subject_id} does not exist")
-            except ValueError:
-                errors.append(f"Row {row_num}: Subject ID must be a number")
-        
-        # Check Marks Obtained
-        if pd.isna(row['Marks Obtained']):
-            errors.append(f"Row {row_num}: Marks Obtained is required")
-        else:
-            try:
-                marks_obtained = float(row['Marks Obtained'])
-                if marks_obtained < 0:
-                    errors.append(f"Row {row_num}: Marks Obtained cannot be negative")
-            except ValueError:
-                errors.append(f"Row {row_num}: Marks Obtained must be a number")
-        
-        # Check Max Marks
-        if pd.isna(row['Max Marks']):
-            errors.append(f"Row {row_num}: Max Marks is required")
-        else:
-            try:
-                max_marks = float(row['Max Marks'])
-                if max_marks <= 0:
-                    errors.append(f"Row {row_num}: Max Marks must be greater than 0")
-            except ValueError:
-                errors.append(f"Row {row_num}: Max Marks must be a number")
-        
-        # Check if marks obtained > max marks
-        if not pd.isna(row['Marks Obtained']) and not pd.isna(row['Max Marks']):
-            try:
-                if float(row['Marks Obtained']) > float(row['Max Marks']):
-                    errors.append(f"Row {row_num}: Marks Obtained cannot exceed Max Marks")
-            except ValueError:
-                pass  # Already handled above
-        
-        # Check Assessment Date if present
-        if 'Assessment Date' in df.columns and not pd.isna(row['Assessment Date']):
-            try:
-                if isinstance(row['Assessment Date'], str):
-                    datetime.strptime(row['Assessment Date'], '%Y-%m-%d')
-                elif isinstance(row['Assessment Date'], datetime):
-                    pass
-                else:
-                    errors.append(f"Row {row_num}: Invalid Assessment Date format. Use YYYY-MM-DD")
-            except ValueError:
-                errors.append(f"Row {row_num}: Invalid Assessment Date format. Use YYYY-MM-DD")
-    
-    return len(errors) == 0, errors, warnings
-
-def import_students_data(df):
-    """Import students data from DataFrame"""
-    success_count = 0
-    error_count = 0
-    errors = []
-    
-    for index, row in df.iterrows():
-        try:
-            name = str(row['Name']).strip()
-            class_name = str(row['Class']).strip()
-            section = str(row['Section']).strip()
-            
-            # Handle DOB
-            dob = None
-            if 'DOB' in df.columns and not pd.isna(row['DOB']):
-                if isinstance(row['DOB'], str):
-                    dob = datetime.strptime(row['DOB'], '%Y-%m-%d').date()
-                elif isinstance(row['DOB'], datetime):
-                    dob = row['DOB'].date()
-            
-            # Validate data
-            valid, validation_errors = Student.validate_student_data(name, class_name, section, dob)
-            if not valid:
-                errors.append(f"Row {index + 2}: {', '.join(validation_errors)}")
-                error_count += 1
-                continue
-            
-            # Add student
-            student_id = Student.add_student(name, class_name, section, dob)
-            if student_id:
-                success_count += 1
-            else:
-                errors.append(f"Row {index + 2}: Failed to add student")
-                error_count += 1
-                
-        except Exception as e:
-            errors.append(f"Row {index + 2}: {str(e)}")
-            error_count += 1
-    
-    return success_count, error_count, errors
-
-def import_subjects_data(df):
-    """Import subjects data from DataFrame"""
-    success_count = 0
-    error_count = 0
-    errors = []
-    
-    for index, row in df.iterrows():
-        try:
-            subject_name = str(row['Subject Name']).strip()
-            
-            # Validate data
-            valid, validation_errors = Subject.validate_subject_data(subject_name)
-            if not valid:
-                errors.append(f"Row {index + 2}: {', '.join(validation_errors)}")
-                error_count += 1
-                continue
-            
-            # Add subject
-            subject_id = Subject.add_subject(subject_name)
-            if subject_id:
-                success_count += 1
-            else:
-                errors.append(f"Row {index + 2}: Failed to add subject")
-                error_count += 1
-                
-        except Exception as e:
-            errors.append(f"Row {index + 2}: {str(e)}")
-            error_count += 1
-    
-    return success_count, error_count, errors
-
-def import_marks_data(df):
-    """Import marks data from DataFrame"""
-    success_count = 0
-    error_count = 0
-    errors = []
-    
-    for index, row in df.iterrows():
-        try:
-            student_id = int(row['Student ID'])
-            subject_id = int(row['Subject ID'])
-            marks_obtained = float(row['Marks Obtained'])
-            max_marks = float(row['Max Marks'])
-            
-            # Handle Assessment Date
-            assessment_date = date.today()
-            if 'Assessment Date' in df.columns and not pd.isna(row['Assessment Date']):
-                if isinstance(row['Assessment Date'], str):
-                    assessment_date = datetime.strptime(row['Assessment Date'], '%Y-%m-%d').date()
-                elif isinstance(row['Assessment Date'], datetime):
-                    assessment_date = row['Assessment Date'].date()
-            
-            # Handle Assessment Type
-            assessment_type = "Final"
-            if 'Assessment Type' in df.columns and not pd.isna(row['Assessment Type']):
-                assessment_type = str(row['Assessment Type']).strip()
-            
-            # Validate data
-            valid, validation_errors = Marks.validate_marks_data(marks_obtained, max_marks, assessment_date)
-            if not valid:
-                errors.append(f"Row {index + 2}: {', '.join(validation_errors)}")
-                error_count += 1
-                continue
-            
-            # Add marks
-            marks_id = Marks.add_marks(student_id, subject_id, marks_obtained, max_marks, assessment_date, assessment_type)
-            if marks_id:
-                success_count += 1
-            else:
-                errors.append(f"Row {index + 2}: Failed to add marks")
-                error_count += 1
-                
-        except Exception as e:
-            errors.append(f"Row {index + 2}: {str(e)}")
-            error_count += 1
-    
-    return success_count, error_count, errors
-
-# Main content area
-st.markdown("---")
-
-# File upload section
-st.subheader(f"📁 Upload {import_type} Data File")
-
-uploaded_file = st.file_uploader(
-    f"Choose {import_type} file",
-    type=['csv', 'xlsx', 'xls'],
-    help=f"Upload a CSV or Excel file containing {import_type.lower()} data"
-)
-
-if uploaded_file is not None:
-    try:
-        # Read the file
-        if uploaded_file.name.endswith('.csv'):
-            df = pd.read_csv(uploaded_file)
-        else:
-            df = pd.read_excel(uploaded_file)
-        
-        st.success(f"✅ File uploaded successfully! Found {len(df)} rows of data.")
-        
-        # Display preview
-        st.subheader("📋 Data Preview")
-        st.dataframe(df.head(10), use_container_width=True)
-        
-        # Validate data
-        st.subheader("🔍 Data Validation")
-        with st.spinner("Validating data..."):
-            if import_type == "Students":
-                is_valid, errors, warnings = validate_student_data(df)
-            elif import_type == "Subjects":
-                is_valid, errors, warnings = validate_subject_data(df)
-            elif import_type == "Marks":
-                is_valid, errors, warnings = validate_marks_data(df)
-        
-        # Display validation results
-        if is_valid:
-            st.success("✅ All data is valid!")
-        else:
-            st.error(f"❌ Found {len(errors)} validation errors:")
-            for error in errors[:10]:  # Show first 10 errors
-                st.write(f"• {error}")
-            if len(errors) > 10:
-                st.write(f"... and {len(errors) - 10} more errors")
-        
-        if warnings:
-            st.warning("⚠️ Warnings:")
-            for warning in warnings:
-                st.write(f"• {warning}")
-        
-        # Import button
-        if is_valid:
-            st.subheader("🚀 Import Data")
-            if st.button(f"Import {len(df)} {import_type.lower()} records", type="primary"):
-                with st.spinner(f"Importing {import_type.lower()} data..."):
-                    if import_type == "Students":
-                        success_count, error_count, import_errors = import_students_data(df)
-                    elif import_type == "Subjects":
-                        success_count, error_count, import_errors = import_subjects_data(df)
-                    elif import_type == "Marks":
-                        success_count, error_count, import_errors = import_marks_data(df)
-                
-                # Display import results
-                col1, col2, col3 = st.columns(3)
-                with col1:
-                    st.metric("✅ Successfully Imported", success_count)
-                with col2:
-                    st.metric("❌ Failed", error_count)
-                with col3:
-                    st.metric("📊 Total Records", len(df))
-                
-                if import_errors:
-                    with st.expander("❌ Import Errors"):
-                        for error in import_errors:
-                            st.write(f"• {error}")
-                
-                if success_count > 0:
-                    st.success(f"🎉 Successfully imported {success_count} {import_type.lower()} records!")
-                    
-                    # Show recent additions
-                    with st.expander("📋 Recent Additions"):
-                        if import_type == "Students":
-                            recent_data = Student.get_all_students()[-5:]
-                            for student in recent_data:
-                                st.write(f"• {student[1]} (Class {student[2]}-{student[3]})")
-                        elif import_type == "Subjects":
-                            recent_data = Subject.get_all_subjects()[-5:]
-                            for subject in recent_data:
-                                st.write(f"• {subject[1]}")
-                        elif import_type == "Marks":
-                            st.write("Marks data imported successfully")
-        
-    except Exception as e:
-        st.error(f"❌ Error reading file: {str(e)}")
-
-# Sample file download section
-st.markdown("---")
-st.subheader("📄 Download Sample Files")
-
-col1, col2, col3 = st.columns(3)
-
-with col1:
-    if st.button("📥 Download Sample Students CSV"):
-        sample_students = pd.DataFrame({
-            'Name': ['John Doe', 'Jane Smith', 'Mike Johnson'],
-            'Class': ['10', '11', '12'],
-            'Section': ['A', 'B', 'C'],
-            'DOB': ['2008-05-15', '2007-03-20', '2006-11-10']
-        })
-        csv = sample_students.to_csv(index=False)
-        st.download_button(
-            label="Download Sample Students CSV",
-            data=csv,
-            file_name="sample_students.csv",
-            mime="text/csv"
-        )
-
-with col2:
-    if st.button("📥 Download Sample Subjects CSV"):
-        sample_subjects = pd.DataFrame({
-            'Subject Name': ['Mathematics', 'Physics', 'Chemistry', 'Biology', 'English']
-        })
-        csv = sample_subjects.to_csv(index=False)
-        st.download_button(
-            label="Download Sample Subjects CSV",
-            data=csv,
-            file_name="sample_subjects.csv",
-            mime="text/csv"
-        )
-
-with col3:
-    if st.button("📥 Download Sample Marks CSV"):
-        sample_marks = pd.DataFrame({
-            'Student ID': [1, 1, 2, 2, 3],
-            'Subject ID': [1, 2, 1, 3, 2],
-            'Marks Obtained': [85, 78, 92, 88, 75],
-            'Max Marks': [100, 100, 100, 100, 100],
-            'Assessment Date': ['2024-01-15', '2024-01-16', '2024-01-15', '2024-01-17', '2024-01-16'],
-            'Assessment Type': ['Final', 'Final', 'Final', 'Final', 'Final']
-        })
-        csv = sample_marks.to_csv(index=False)
-        st.download_button(
-            label="Download Sample Marks CSV",
-            data=csv,
-            file_name="sample_marks.csv",
-            mime="text/csv"
-        )
-
-# Instructions section
-st.markdown("---")
-st.subheader("📖 Instructions")
-
-with st.expander("How to use Bulk Import"):
-    st.markdown("""
-    ### Step-by-Step Guide:
-    
-    1. **Prepare Your Data**: Create a CSV or Excel file with the required columns
-    2. **Download Sample Files**: Use the sample files above as templates
-    3. **Upload File**: Choose your file using the upload button
-    4. **Validate Data**: The system will automatically validate your data
-    5. **Import**: Click the import button to add the data to the system
-    
-    ### File Format Requirements:
-    
-    **Students File:**
-    - Name (required): Student's full name
-    - Class (required): 10, 11, or 12
-    - Section (required): A, B, or C
-    - DOB (optional): Date of birth in YYYY-MM-DD format
-    
-    **Subjects File:**
-    - Subject Name (required): Name of the subject
-    
-    **Marks File:**
-    - Student ID (required): Existing student ID from the system
-    - Subject ID (required): Existing subject ID from the system
-    - Marks Obtained (required): Numeric value
-    - Max Marks (required): Numeric value
-    - Assessment Date (optional): Date in YYYY-MM-DD format
-    - Assessment Type (optional): Type of assessment (e.g., "Final", "Mid-term")
-    
-    ### Tips:
-    - Use the sample files as templates
-    - Ensure all required fields are filled
-    - Check that Student IDs and Subject IDs exist in the system
-    - Use consistent date formats (YYYY-MM-DD)
-    """)
-
-# Current data summary
-st.markdown("---")
-st.subheader("📊 Current Data Summary")
-
-col1, col2, col3 = st.columns(3)
-
-with col1:
-    try:
-        students_count = len(Student.get_all_students())
-        st.metric("👥 Total Students", students_count)
-    except:
-        st.metric("👥 Total Students", 0)
-
-with col2:
-    try:
-        subjects_count = len(Subject.get_all_subjects())
-        st.metric("📚 Total Subjects", subjects_count)
-    except:
-        st.metric("📚 Total Subjects", 0)
-
-with col3:
-    try:
-        marks_count = len(Marks.get_all_marks())
-        st.metric("📝 Total Marks Records", marks_count)
-    except:
-        st.metric("📝 Total Marks Records", 0)
-
+"""
+Bulk Data Import Page - Import Excel/CSV files for students, subjects, and marks
+"""
+import streamlit as st
+import pandas as pd
+import numpy as np
+from datetime import date, datetime
+import sys
+import os
+import io
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models.student import Student
+from models.subject import Subject
+from models.marks import Marks
+
+st.set_page_config(
+    page_title="Bulk Data Import",
+    page_icon="📥",
+    layout="wide"
+)
+
+st.title("📥 Bulk Data Import")
+st.markdown("Import student, subject, and marks data from Excel or CSV files")
+
+# Sidebar for navigation
+with st.sidebar:
+    st.subheader("Import Options")
+    import_type = st.radio(
+        "Choose Data Type:",
+        ["Students", "Subjects", "Marks"],
+        key="import_type"
+    )
+    
+    st.markdown("---")
+    st.markdown("### 📋 File Requirements")
+    
+    if import_type == "Students":
+        st.markdown("""
+        **Students CSV/Excel Format:**
+        - Name (required)
+        - Class (required)
+        - Section (required)
+        - DOB (YYYY-MM-DD format)
+        """)
+    elif import_type == "Subjects":
+        st.markdown("""
+        **Subjects CSV/Excel Format:**
+        - Subject Name (required)
+        """)
+    elif import_type == "Marks":
+        st.markdown("""
+        **Marks CSV/Excel Format:**
+        - Student ID (required)
+        - Subject ID (required)
+        - Marks Obtained (required)
+        - Max Marks (required)
+        - Assessment Date (YYYY-MM-DD format)
+        - Assessment Type (optional)
+        """)
+
+# Fixed read schemas per import type: usecols prunes unrelated columns inside
+# the parser and explicit dtypes skip whole-file type inference
+IMPORT_SCHEMAS = {
+    'Students': {'Name': 'string', 'Class': 'category', 'Section': 'category', 'DOB': 'string'},
+    'Subjects': {'Subject Name': 'string'},
+    'Marks': {'Student ID': 'string', 'Subject ID': 'string',
+              'Marks Obtained': 'string', 'Max Marks': 'string',
+              'Assessment Date': 'string', 'Assessment Type': 'string'},
+}
+
+# Valid domains are fixed and tiny, so they are frozen once at module load;
+# assessment types mirror the CHECK constraint on the Marks table
+VALID_CLASSES = frozenset({'10', '11', '12'})
+VALID_SECTIONS = frozenset({'A', 'B', 'C'})
+VALID_ASSESSMENT_TYPES = frozenset({'Quiz', 'Assignment', 'Midterm', 'Final', 'Project'})
+
+def _error_rows(mask, df):
+    """Spreadsheet row numbers (1-based plus header) where a boolean mask is set"""
+    return df.index.to_numpy()[np.asarray(mask)] + 2
+
+def _outside_domain(raw, stripped, valid_values):
+    """Mask of values outside a fixed domain. Categorical columns compare
+    their handful of categories against the domain first, so a fully valid
+    column short-circuits without touching any rows."""
+    if isinstance(raw.dtype, pd.CategoricalDtype):
+        categories = {str(c).strip() for c in raw.cat.categories}
+        if not categories - valid_values:
+            return pd.Series(False, index=raw.index)
+    return ~stripped.isin(valid_values)
+
+def validate_student_data(df):
+    """Validate student data from DataFrame; also returns the coerced
+    columns so the importer does not have to parse them again"""
+    errors = []
+    warnings = []
+    
+    # Check required columns
+    required_columns = ['Name', 'Class', 'Section']
+    missing_columns = [col for col in required_columns if col not in df.columns]
+    if missing_columns:
+        errors.append(f"Missing required columns: {', '.join(missing_columns)}")
+        return False, errors, warnings, None
+    
+    # Column-wise masks replace the per-row Python loop: one vectorized pass
+    # per rule, with row numbers recovered from the mask indices
+    names = df['Name'].astype(str).str.strip()
+    name_missing = df['Name'].isna() | names.eq('')
+    name_too_short = ~name_missing & (names.str.len() < 2)
+    name_too_long = ~name_missing & (names.str.len() > 100)
+    errors.extend(f"Row {r}: Name is required" for r in _error_rows(name_missing, df))
+    errors.extend(f"Row {r}: Name must be at least 2 characters long"
+                  for r in _error_rows(name_too_short, df))
+    errors.extend(f"Row {r}: Name cannot exceed 100 characters"
+                  for r in _error_rows(name_too_long, df))
+    
+    classes = df['Class'].astype(str).str.strip()
+    class_missing = df['Class'].isna() | classes.eq('')
+    class_invalid = ~class_missing & _outside_domain(df['Class'], classes, VALID_CLASSES)
+    errors.extend(f"Row {r}: Class is required" for r in _error_rows(class_missing, df))
+    errors.extend(f"Row {r}: Class must be 10, 11, or 12" for r in _error_rows(class_invalid, df))
+    
+    sections = df['Section'].astype(str).str.strip()
+    section_missing = df['Section'].isna() | sections.eq('')
+    section_invalid = ~section_missing & _outside_domain(df['Section'], sections, VALID_SECTIONS)
+    errors.extend(f"Row {r}: Section is required" for r in _error_rows(section_missing, df))
+    errors.extend(f"Row {r}: Section must be A, B, or C" for r in _error_rows(section_invalid, df))
+    
+    # The model-level DOB rules run here in vectorized form so the importer
+    # does not have to revalidate row by row
+    parsed_dob = None
+    if 'DOB' in df.columns:
+        parsed_dob = pd.to_datetime(df['DOB'], format='%Y-%m-%d', errors='coerce', cache=True)
+        dob_invalid = df['DOB'].notna() & parsed_dob.isna()
+        dob_missing = df['DOB'].isna()
+        dob_future = parsed_dob >= pd.Timestamp(date.today())
+        dob_too_old = parsed_dob < pd.Timestamp(1900, 1, 1)
+        errors.extend(f"Row {r}: Invalid DOB format. Use YYYY-MM-DD"
+                      for r in _error_rows(dob_invalid, df))
+        errors.extend(f"Row {r}: Date of birth is required" for r in _error_rows(dob_missing, df))
+        errors.extend(f"Row {r}: Date of birth must be in the past"
+                      for r in _error_rows(dob_future, df))
+        errors.extend(f"Row {r}: Invalid date of birth" for r in _error_rows(dob_too_old, df))
+    else:
+        errors.extend(f"Row {r}: Date of birth is required"
+                      for r in df.index.to_numpy() + 2)
+    
+    coerced = {'Name': names, 'Class': classes, 'Section': sections, 'DOB': parsed_dob}
+    return len(errors) == 0, errors, warnings, coerced
+
+def validate_subject_data(df):
+    """Validate subject data from DataFrame; also returns the stripped
+    names so the importer can reuse them"""
+    errors = []
+    warnings = []
+    
+    # Check required columns
+    if 'Subject Name' not in df.columns:
+        errors.append("Missing required column: Subject Name")
+        return False, errors, warnings, None
+    
+    # Vectorized length checks on the stripped names
+    stripped = df['Subject Name'].astype(str).str.strip()
+    name_missing = df['Subject Name'].isna() | stripped.eq('')
+    too_short = ~name_missing & (stripped.str.len() < 2)
+    too_long = ~name_missing & (stripped.str.len() > 50)
+    errors.extend(f"Row {r}: Subject Name is required" for r in _error_rows(name_missing, df))
+    errors.extend(f"Row {r}: Subject Name must be at least 2 characters"
+                  for r in _error_rows(too_short, df))
+    errors.extend(f"Row {r}: Subject Name must be less than 50 characters"
+                  for r in _error_rows(too_long, df))
+    
+    # Duplicate check against the database runs once for the whole column
+    # instead of one lookup per row
+    existing_names = {str(row[1]).lower() for row in Subject.get_all_subjects()}
+    duplicate = ~name_missing & stripped.str.lower().isin(existing_names)
+    errors.extend(f"Row {r}: Subject already exists" for r in _error_rows(duplicate, df))
+    
+    return len(errors) == 0, errors, warnings, {'Subject Name': stripped}
+
+_MARKS_RANGE_MESSAGES = (
+    (1, "Marks Obtained cannot be negative"),
+    (2, "Max Marks must be greater than 0"),
+    (4, "Marks Obtained cannot exceed Max Marks"),
+)
+
+def _marks_range_codes(obtained, maximum):
+    """Bit-packed range violations per row, computed branch-free on the raw
+    float arrays; NaNs from coercion fail every comparison and set no bits"""
+    return ((obtained < 0).view(np.uint8)
+            | ((maximum <= 0).view(np.uint8) << 1)
+            | ((obtained > maximum).view(np.uint8) << 2))
+
+def validate_marks_data(df):
+    """Validate marks data from DataFrame; also returns the coerced
+    columns so the importer does not have to parse them again"""
+    errors = []
+    warnings = []
+    
+    # Check required columns
+    required_columns = ['Student ID', 'Subject ID', 'Marks Obtained', 'Max Marks']
+    missing_columns = [col for col in required_columns if col not in df.columns]
+    if missing_columns:
+        errors.append(f"Missing required columns: {', '.join(missing_columns)}")
+        return False, errors, warnings, None
+    
+    # Coerce each column once; non-numeric values show up as NaN in the
+    # coerced series while still being present in the raw one
+    student_ids = pd.to_numeric(df['Student ID'], errors='coerce')
+    sid_missing = df['Student ID'].isna()
+    sid_not_number = ~sid_missing & student_ids.isna()
+    errors.extend(f"Row {r}: Student ID is required" for r in _error_rows(sid_missing, df))
+    errors.extend(f"Row {r}: Student ID must be a number" for r in _error_rows(sid_not_number, df))
+    
+    subject_ids = pd.to_numeric(df['Subject ID'], errors='coerce')
+    subid_missing = df['Subject ID'].isna()
+    subid_not_number = ~subid_missing & subject_ids.isna()
+    errors.extend(f"Row {r}: Subject ID is required" for r in _error_rows(subid_missing, df))
+    errors.extend(f"Row {r}: Subject ID must be a number" for r in _error_rows(subid_not_number, df))
+    
+    # Existence checks run as one batched IN query per table, not per row
+    existing_students = Student.get_existing_ids(
+        student_ids.dropna().astype(int).unique().tolist())
+    sid_unknown = student_ids.notna() & ~student_ids.isin(existing_students)
+    for r, sid in zip(_error_rows(sid_unknown, df), student_ids[sid_unknown].astype(int)):
+        errors.append(f"Row {r}: Student ID {sid} does not exist")
+    
+    existing_subjects = Subject.get_existing_ids(
+        subject_ids.dropna().astype(int).unique().tolist())
+    subid_unknown = subject_ids.notna() & ~subject_ids.isin(existing_subjects)
+    for r, sid in zip(_error_rows(subid_unknown, df), subject_ids[subid_unknown].astype(int)):
+        errors.append(f"Row {r}: Subject ID {sid} does not exist")
+    
+    marks_obtained = pd.to_numeric(df['Marks Obtained'], errors='coerce')
+    marks_missing = df['Marks Obtained'].isna()
+    marks_not_number = ~marks_missing & marks_obtained.isna()
+    errors.extend(f"Row {r}: Marks Obtained is required" for r in _error_rows(marks_missing, df))
+    errors.extend(f"Row {r}: Marks Obtained must be a number"
+                  for r in _error_rows(marks_not_number, df))
+    
+    max_marks = pd.to_numeric(df['Max Marks'], errors='coerce')
+    max_missing = df['Max Marks'].isna()
+    max_not_number = ~max_missing & max_marks.isna()
+    errors.extend(f"Row {r}: Max Marks is required" for r in _error_rows(max_missing, df))
+    errors.extend(f"Row {r}: Max Marks must be a number" for r in _error_rows(max_not_number, df))
+    
+    # All three range rules come from one bit-packed pass over the raw arrays
+    range_codes = _marks_range_codes(marks_obtained.to_numpy(dtype=np.float64),
+                                     max_marks.to_numpy(dtype=np.float64))
+    for bit, message in _MARKS_RANGE_MESSAGES:
+        errors.extend(f"Row {r}: {message}" for r in _error_rows((range_codes & bit) != 0, df))
+    
+    max_too_high = max_marks > 1000
+    errors.extend(f"Row {r}: Maximum marks seems too high (limit: 1000)"
+                  for r in _error_rows(max_too_high, df))
+    
+    parsed_dates = None
+    if 'Assessment Date' in df.columns:
+        parsed_dates = pd.to_datetime(df['Assessment Date'], format='%Y-%m-%d', errors='coerce', cache=True)
+        date_invalid = df['Assessment Date'].notna() & parsed_dates.isna()
+        date_future = parsed_dates > pd.Timestamp(date.today())
+        errors.extend(f"Row {r}: Invalid Assessment Date format. Use YYYY-MM-DD"
+                      for r in _error_rows(date_invalid, df))
+        errors.extend(f"Row {r}: Assessment date cannot be in the future"
+                      for r in _error_rows(date_future, df))
+    
+    # The Marks table CHECKs assessment_type, so anything outside the domain
+    # must be caught here - one bad value would otherwise roll back a whole
+    # executemany slice on insert
+    assessment_types = None
+    if 'Assessment Type' in df.columns:
+        assessment_types = df['Assessment Type'].astype('string').str.strip()
+        type_invalid = assessment_types.notna() & _outside_domain(
+            df['Assessment Type'], assessment_types, VALID_ASSESSMENT_TYPES)
+        errors.extend(
+            f"Row {r}: Assessment Type must be Quiz, Assignment, Midterm, Final, or Project"
+            for r in _error_rows(type_invalid, df))
+
+    coerced = {'Student ID': student_ids, 'Subject ID': subject_ids,
+               'Marks Obtained': marks_obtained, 'Max Marks': max_marks,
+               'Assessment Date': parsed_dates, 'Assessment Type': assessment_types}
+    return len(errors) == 0, errors, warnings, coerced
+
+def import_students_data(df, coerced=None):
+    """Import students data from DataFrame, reusing the columns the
+    validator already coerced when available"""
+    errors = []
+    
+    if coerced is None:
+        _, _, _, coerced = validate_student_data(df)
+    
+    # Pull each column out as a plain array once so the row loop walks
+    # packed arrays instead of pandas Series
+    names = coerced['Name'].to_numpy()
+    classes = coerced['Class'].to_numpy()
+    sections = coerced['Section'].to_numpy()
+    if coerced['DOB'] is not None:
+        dobs = [ts.date() if pd.notna(ts) else None for ts in coerced['DOB']]
+    else:
+        dobs = [None] * len(df)
+    
+    # The vectorized validator already ran over the whole frame, so rows go
+    # straight into the batch without per-row revalidation
+    rows = list(zip(names, classes, sections, dobs))
+    
+    success_count = Student.bulk_add(rows) if rows else 0
+    if rows and success_count == 0:
+        errors.append("Bulk insert failed - no student rows were written")
+    error_count = len(df) - success_count
+    
+    return success_count, error_count, errors
+
+def import_subjects_data(df, coerced=None):
+    """Import subjects data from DataFrame, reusing the stripped names
+    from the validator when available"""
+    errors = []
+    
+    if coerced is None:
+        _, _, _, coerced = validate_subject_data(df)
+    subject_names = coerced['Subject Name'].to_numpy()
+    
+    rows = [(subject_name,) for subject_name in subject_names]
+    
+    success_count = Subject.bulk_add(rows) if rows else 0
+    if rows and success_count == 0:
+        errors.append("Bulk insert failed - no subject rows were written")
+    error_count = len(df) - success_count
+    
+    return success_count, error_count, errors
+
+def import_marks_data(df, coerced=None):
+    """Import marks data from DataFrame, reusing the columns the validator
+    already coerced when available"""
+    errors = []
+    
+    if coerced is None:
+        _, _, _, coerced = validate_marks_data(df)
+    
+    student_ids = coerced['Student ID'].to_numpy()
+    subject_ids = coerced['Subject ID'].to_numpy()
+    marks_obtained = coerced['Marks Obtained'].to_numpy()
+    max_marks = coerced['Max Marks'].to_numpy()
+    
+    if coerced['Assessment Date'] is not None:
+        assessment_dates = [ts.date() if pd.notna(ts) else date.today()
+                            for ts in coerced['Assessment Date']]
+    else:
+        assessment_dates = [date.today()] * len(df)
+    
+    if coerced.get('Assessment Type') is not None:
+        assessment_types = coerced['Assessment Type'].fillna("Final").to_numpy()
+    else:
+        assessment_types = ["Final"] * len(df)
+    
+    rows = [(int(sid), int(subid), float(obtained), float(maximum),
+             assessment_date, assessment_type)
+            for sid, subid, obtained, maximum, assessment_date, assessment_type in zip(
+                student_ids, subject_ids, marks_obtained, max_marks,
+                assessment_dates, assessment_types)]
+    
+    success_count = Marks.bulk_add(rows) if rows else 0
+    if rows and success_count < len(rows):
+        # A row the database rejects rolls back its whole executemany slice;
+        # retry the unwritten tail one row at a time so a single bad row no
+        # longer takes thousands with it, and name the rows that fail
+        row_numbers = _error_rows(pd.Series(True, index=df.index), df)
+        for offset in range(success_count, len(rows)):
+            if Marks.add_marks(*rows[offset]):
+                success_count += 1
+            else:
+                errors.append(f"Row {row_numbers[offset]}: database rejected this row")
+    error_count = len(df) - success_count
+
+    return success_count, error_count, errors
+
+# Files above this size stream through the import in row chunks instead of
+# being materialized as one DataFrame
+_CHUNKED_IMPORT_THRESHOLD = 50 * 1024 * 1024
+_CHUNK_ROWS = 50_000
+
+def _run_chunked_import(uploaded_file):
+    """Validate and import a large CSV chunk by chunk so peak memory is
+    bounded by the chunk size rather than the file size"""
+    schema = IMPORT_SCHEMAS[import_type]
+    validators = {
+        "Students": validate_student_data,
+        "Subjects": validate_subject_data,
+        "Marks": validate_marks_data,
+    }
+    importers = {
+        "Students": import_students_data,
+        "Subjects": import_subjects_data,
+        "Marks": import_marks_data,
+    }
+
+    st.info(f"📦 Large file detected ({uploaded_file.size / (1024 * 1024):.0f} MB) - "
+            f"data will be imported in chunks of {_CHUNK_ROWS:,} rows.")
+
+    if not st.button(f"Import {import_type.lower()} records in chunks", type="primary"):
+        return
+
+    # The pyarrow engine does not support chunksize, so the streaming path
+    # always uses the C engine
+    reader = pd.read_csv(uploaded_file, usecols=lambda c: c in schema,
+                         dtype=schema, chunksize=_CHUNK_ROWS)
+    progress = st.progress(0.0, text="Importing...")
+    total_rows = 0
+    total_success = 0
+    total_errors = 0
+    all_errors = []
+
+    def _write_chunk(chunk, future):
+        """Consume one validated chunk on the main thread, keeping SQLite
+        writes single-threaded"""
+        nonlocal total_rows, total_success, total_errors
+        is_valid, errors, _, coerced = future.result()
+        if is_valid:
+            success_count, error_count, import_errors = importers[import_type](chunk, coerced)
+            all_errors.extend(import_errors)
+        else:
+            success_count, error_count = 0, len(chunk)
+            all_errors.extend(errors)
+        total_rows += len(chunk)
+        total_success += success_count
+        total_errors += error_count
+        progress.progress(min(uploaded_file.tell() / uploaded_file.size, 1.0),
+                          text=f"Processed {total_rows:,} rows...")
+
+    # Validation is CPU-bound pandas/numpy work that releases the GIL, so
+    # chunks validate in a small thread pool while the main thread writes;
+    # the bounded deque keeps at most max_workers chunks in memory
+    max_workers = min(4, os.cpu_count() or 1)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        in_flight = deque()
+        for chunk in reader:
+            in_flight.append((chunk, executor.submit(validators[import_type], chunk)))
+            if len(in_flight) >= max_workers:
+                _write_chunk(*in_flight.popleft())
+        while in_flight:
+            _write_chunk(*in_flight.popleft())
+    progress.progress(1.0, text=f"Processed {total_rows:,} rows")
+
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("✅ Successfully Imported", total_success)
+    with col2:
+        st.metric("❌ Failed", total_errors)
+    with col3:
+        st.metric("📊 Total Records", total_rows)
+
+    if all_errors:
+        with st.expander("❌ Import Errors"):
+            for error in all_errors[:50]:
+                st.write(f"• {error}")
+            if len(all_errors) > 50:
+                st.write(f"... and {len(all_errors) - 50} more errors")
+
+    if total_success > 0:
+        st.success(f"🎉 Successfully imported {total_success} {import_type.lower()} records!")
+        # Every cached count and aggregate is stale after a bulk write
+        st.cache_data.clear()
+
+# Main content area
+st.markdown("---")
+
+# File upload section
+st.subheader(f"📁 Upload {import_type} Data File")
+
+uploaded_file = st.file_uploader(
+    f"Choose {import_type} file",
+    type=['csv', 'xlsx', 'xls'],
+    help=f"Upload a CSV or Excel file containing {import_type.lower()} data"
+)
+
+if (uploaded_file is not None and uploaded_file.name.endswith('.csv')
+        and uploaded_file.size > _CHUNKED_IMPORT_THRESHOLD):
+    _run_chunked_import(uploaded_file)
+elif uploaded_file is not None:
+    try:
+        # Read the file against the fixed schema for this import type
+        schema = IMPORT_SCHEMAS[import_type]
+        if uploaded_file.name.endswith('.csv'):
+            try:
+                # The pyarrow engine parses multi-threaded; it does not take a
+                # callable usecols, so unexpected columns are dropped after
+                df = pd.read_csv(uploaded_file, engine='pyarrow', dtype=schema)
+                df = df[[col for col in df.columns if col in schema]]
+            except (ImportError, ValueError):
+                uploaded_file.seek(0)
+                df = pd.read_csv(uploaded_file, usecols=lambda c: c in schema, dtype=schema)
+        else:
+            try:
+                # calamine streams the workbook in Rust instead of building a
+                # Python object per cell
+                df = pd.read_excel(uploaded_file, engine='calamine',
+                                   usecols=lambda c: c in schema, dtype=schema)
+            except (ImportError, ValueError):
+                uploaded_file.seek(0)
+                df = pd.read_excel(uploaded_file, usecols=lambda c: c in schema, dtype=schema)
+        
+        st.success(f"✅ File uploaded successfully! Found {len(df)} rows of data.")
+        
+        # Display preview
+        st.subheader("📋 Data Preview")
+        st.dataframe(df.head(10), use_container_width=True)
+        
+        # Validate data
+        st.subheader("🔍 Data Validation")
+        with st.spinner("Validating data..."):
+            if import_type == "Students":
+                is_valid, errors, warnings, coerced = validate_student_data(df)
+            elif import_type == "Subjects":
+                is_valid, errors, warnings, coerced = validate_subject_data(df)
+            elif import_type == "Marks":
+                is_valid, errors, warnings, coerced = validate_marks_data(df)
+        
+        # Display validation results
+        if is_valid:
+            st.success("✅ All data is valid!")
+        else:
+            st.error(f"❌ Found {len(errors)} validation errors:")
+            for error in errors[:10]:  # Show first 10 errors
+                st.write(f"• {error}")
+            if len(errors) > 10:
+                st.write(f"... and {len(errors) - 10} more errors")
+        
+        if warnings:
+            st.warning("⚠️ Warnings:")
+            for warning in warnings:
+                st.write(f"• {warning}")
+        
+        # Import button
+        if is_valid:
+            st.subheader("🚀 Import Data")
+            if st.button(f"Import {len(df)} {import_type.lower()} records", type="primary"):
+                with st.spinner(f"Importing {import_type.lower()} data..."):
+                    if import_type == "Students":
+                        success_count, error_count, import_errors = import_students_data(df, coerced)
+                    elif import_type == "Subjects":
+                        success_count, error_count, import_errors = import_subjects_data(df, coerced)
+                    elif import_type == "Marks":
+                        success_count, error_count, import_errors = import_marks_data(df, coerced)
+                
+                # Display import results
+                col1, col2, col3 = st.columns(3)
+                with col1:
+                    st.metric("✅ Successfully Imported", success_count)
+                with col2:
+                    st.metric("❌ Failed", error_count)
+                with col3:
+                    st.metric("📊 Total Records", len(df))
+                
+                if import_errors:
+                    with st.expander("❌ Import Errors"):
+                        for error in import_errors:
+                            st.write(f"• {error}")
+                
+                if success_count > 0:
+                    st.success(f"🎉 Successfully imported {success_count} {import_type.lower()} records!")
+                    # Every cached count and aggregate is stale after a bulk write
+                    st.cache_data.clear()
+
+                    # Show recent additions
+                    with st.expander("📋 Recent Additions"):
+                        if import_type == "Students":
+                            recent_data = Student.get_all_students()[-5:]
+                            for student in recent_data:
+                                st.write(f"• {student[1]} (Class {student[2]}-{student[3]})")
+                        elif import_type == "Subjects":
+                            recent_data = Subject.get_all_subjects()[-5:]
+                            for subject in recent_data:
+                                st.write(f"• {subject[1]}")
+                        elif import_type == "Marks":
+                            st.write("Marks data imported successfully")
+        
+    except Exception as e:
+        st.error(f"❌ Error reading file: {str(e)}")
+
+# Sample file download section
+st.markdown("---")
+st.subheader("📄 Download Sample Files")
+
+# The sample files never change, so their bytes are built once and served
+# from the cache on every rerun
+@st.cache_data(show_spinner=False)
+def _sample_students_csv() -> bytes:
+    return pd.DataFrame({
+        'Name': ['John Doe', 'Jane Smith', 'Mike Johnson'],
+        'Class': ['10', '11', '12'],
+        'Section': ['A', 'B', 'C'],
+        'DOB': ['2008-05-15', '2007-03-20', '2006-11-10']
+    }).to_csv(index=False).encode()
+
+@st.cache_data(show_spinner=False)
+def _sample_subjects_csv() -> bytes:
+    return pd.DataFrame({
+        'Subject Name': ['Mathematics', 'Physics', 'Chemistry', 'Biology', 'English']
+    }).to_csv(index=False).encode()
+
+@st.cache_data(show_spinner=False)
+def _sample_marks_csv() -> bytes:
+    return pd.DataFrame({
+        'Student ID': [1, 1, 2, 2, 3],
+        'Subject ID': [1, 2, 1, 3, 2],
+        'Marks Obtained': [85, 78, 92, 88, 75],
+        'Max Marks': [100, 100, 100, 100, 100],
+        'Assessment Date': ['2024-01-15', '2024-01-16', '2024-01-15', '2024-01-17', '2024-01-16'],
+        'Assessment Type': ['Final', 'Final', 'Final', 'Final', 'Final']
+    }).to_csv(index=False).encode()
+
+col1, col2, col3 = st.columns(3)
+
+with col1:
+    st.download_button(
+        label="📥 Download Sample Students CSV",
+        data=_sample_students_csv(),
+        file_name="sample_students.csv",
+        mime="text/csv"
+    )
+
+with col2:
+    st.download_button(
+        label="📥 Download Sample Subjects CSV",
+        data=_sample_subjects_csv(),
+        file_name="sample_subjects.csv",
+        mime="text/csv"
+    )
+
+with col3:
+    st.download_button(
+        label="📥 Download Sample Marks CSV",
+        data=_sample_marks_csv(),
+        file_name="sample_marks.csv",
+        mime="text/csv"
+    )
+
+# Instructions section
+st.markdown("---")
+st.subheader("📖 Instructions")
+
+with st.expander("How to use Bulk Import"):
+    st.markdown("""
+    ### Step-by-Step Guide:
+    
+    1. **Prepare Your Data**: Create a CSV or Excel file with the required columns
+    2. **Download Sample Files**: Use the sample files above as templates
+    3. **Upload File**: Choose your file using the upload button
+    4. **Validate Data**: The system will automatically validate your data
+    5. **Import**: Click the import button to add the data to the system
+    
+    ### File Format Requirements:
+    
+    **Students File:**
+    - Name (required): Student's full name
+    - Class (required): 10, 11, or 12
+    - Section (required): A, B, or C
+    - DOB (optional): Date of birth in YYYY-MM-DD format
+    
+    **Subjects File:**
+    - Subject Name (required): Name of the subject
+    
+    **Marks File:**
+    - Student ID (required): Existing student ID from the system
+    - Subject ID (required): Existing subject ID from the system
+    - Marks Obtained (required): Numeric value
+    - Max Marks (required): Numeric value
+    - Assessment Date (optional): Date in YYYY-MM-DD format
+    - Assessment Type (optional): Quiz, Assignment, Midterm, Final, or Project
+    
+    ### Tips:
+    - Use the sample files as templates
+    - Ensure all required fields are filled
+    - Check that Student IDs and Subject IDs exist in the system
+    - Use consistent date formats (YYYY-MM-DD)
+    """)
+
+# Current data summary
+st.markdown("---")
+st.subheader("📊 Current Data Summary")
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _current_counts() -> tuple:
+    try:
+        students_count = Student.count()
+    except Exception:
+        students_count = 0
+    try:
+        subjects_count = Subject.count()
+    except Exception:
+        subjects_count = 0
+    try:
+        marks_count = Marks.count()
+    except Exception:
+        marks_count = 0
+    return students_count, subjects_count, marks_count
+
+students_count, subjects_count, marks_count = _current_counts()
+
+col1, col2, col3 = st.columns(3)
+
+with col1:
+    st.metric("👥 Total Students", students_count)
+
+with col2:
+    st.metric("📚 Total Subjects", subjects_count)
+
+with col3:
+    st.metric("📝 Total Marks Records", marks_count)
+
@@ -7,8 +7,10 @@ import os
 import pandas as pd
 from datetime import date, datetime
 
-# Add parent directory to path
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Add parent directory to path (idempotent so reruns never grow sys.path)
+_PARENT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _PARENT_DIR not in sys.path:
+    sys.path.append(_PARENT_DIR)
 
 from utils.data_import import (
     create_sample_students_file,
@@ -4,16 +4,28 @@ Analytics utilities for performance calculations and insights (SQLite version)
 import pandas as pd
 import streamlit as st
 from typing import Dict, List, Tuple
-from db.connection import fetch_all, fetch_one  # ✅ Correct SQLite import
+from db.connection import fetch_all, fetch_one, fetch_df  # ✅ Correct SQLite import
 from models.marks import Marks
 
 class PerformanceAnalytics:
     """Class for advanced performance analytics"""
 
+    # SQL twin of Marks.calculate_grade, applied to the rounded percentage
+    # column of the per-student CTE
+    GRADE_CASE_SQL = """CASE
+                WHEN pct >= 90 THEN 'A+'
+                WHEN pct >= 80 THEN 'A'
+                WHEN pct >= 70 THEN 'B+'
+                WHEN pct >= 60 THEN 'B'
+                WHEN pct >= 50 THEN 'C+'
+                WHEN pct >= 40 THEN 'C'
+                ELSE 'F'
+            END"""
+
     @staticmethod
-    def get_grade_distribution(class_name: str = None, section: str = None) -> Dict:
-        """Get distribution of grades across students"""
-        # Build query based on filters
+    def _per_student_cte(class_name: str = None, section: str = None) -> Tuple[str, list]:
+        """Build the shared CTE computing each student's rounded overall
+        percentage, plus its bound parameters"""
         conditions = []
         params = []
 
@@ -29,46 +41,69 @@ class PerformanceAnalytics:
         if where_clause:
             where_clause = f"WHERE {where_clause}"
 
-        query = f"""
-        SELECT s.student_id, s.name, s.class, s.section,
-               SUM(m.marks_obtained) as total_obtained,
-               SUM(m.max_marks) as total_max
-        FROM Student s
-        JOIN Marks m ON s.student_id = m.student_id
-        {where_clause}
-        GROUP BY s.student_id, s.name, s.class, s.section
-        HAVING total_max > 0
+        cte = f"""
+        WITH per_student AS (
+            SELECT s.student_id, s.name, s.class, s.section,
+                   ROUND(SUM(m.marks_obtained) * 100.0 / NULLIF(SUM(m.max_marks), 0), 2) as pct
+            FROM Student s
+            JOIN Marks m ON s.student_id = m.student_id
+            {where_clause}
+            GROUP BY s.student_id, s.name, s.class, s.section
+            HAVING SUM(m.max_marks) > 0
+        )
         """
+        return cte, params
 
-        results = fetch_all(query, tuple(params))
+    @staticmethod
+    def get_grade_counts(class_name: str = None, section: str = None) -> Dict:
+        """Get grade bucket counts; the whole aggregation runs in SQL so
+        only ~7 rows cross the connection"""
+        cte, params = PerformanceAnalytics._per_student_cte(class_name, section)
+        query = f"""{cte}
+        SELECT {PerformanceAnalytics.GRADE_CASE_SQL} as grade, COUNT(*)
+        FROM per_student
+        GROUP BY grade
+        """
 
         grade_counts = {'A+': 0, 'A': 0, 'B+': 0, 'B': 0, 'C+': 0, 'C': 0, 'F': 0}
-        student_grades = []
+        for grade, count in fetch_all(query, tuple(params)):
+            grade_counts[grade] = count
+        return grade_counts
 
-        for result in results:
-            percentage = Marks.calculate_percentage(result[4], result[5])
-            grade = Marks.calculate_grade(percentage)
-            grade_counts[grade] += 1
-            student_grades.append({
-                'student_id': result[0],
-                'name': result[1],
-                'class': result[2],
-                'section': result[3],
-                'percentage': percentage,
-                'grade': grade
-            })
+    @staticmethod
+    def get_student_grades(class_name: str = None, section: str = None) -> List[Dict]:
+        """Get per-student percentages and grades, computed in SQL"""
+        cte, params = PerformanceAnalytics._per_student_cte(class_name, section)
+        query = f"""{cte}
+        SELECT student_id, name, class, section, pct,
+               {PerformanceAnalytics.GRADE_CASE_SQL} as grade
+        FROM per_student
+        """
+
+        return [{
+            'student_id': result[0],
+            'name': result[1],
+            'class': result[2],
+            'section': result[3],
+            'percentage': result[4],
+            'grade': result[5]
+        } for result in fetch_all(query, tuple(params))]
+
+    @staticmethod
+    def get_grade_distribution(class_name: str = None, section: str = None) -> Dict:
+        """Get distribution of grades across students"""
+        grade_counts = PerformanceAnalytics.get_grade_counts(class_name, section)
 
         return {
             'grade_counts': grade_counts,
-            'student_grades': student_grades,
-            'total_students': len(student_grades)
+            'total_students': sum(grade_counts.values())
         }
 
     @staticmethod
     def get_subject_performance_comparison() -> Dict:
         """Compare performance across all subjects"""
         query = """
-        SELECT sub.subject_name,
+        SELECT sub.subject_name as subject,
                COUNT(m.mark_id) as total_assessments,
                AVG(m.marks_obtained) as avg_marks,
                AVG((m.marks_obtained * 100.0) / m.max_marks) as avg_percentage,
@@ -81,21 +116,17 @@ class PerformanceAnalytics:
         ORDER BY avg_percentage DESC
         """
 
-        results = fetch_all(query)
-
-        subjects_data = []
-        for result in results:
-            subjects_data.append({
-                'subject': result[0],
-                'total_assessments': result[1],
-                'avg_marks': round(result[2], 2),
-                'avg_percentage': round(result[3], 2),
-                'highest_marks': result[4],
-                'lowest_marks': result[5],
-                'grade': Marks.calculate_grade(result[3])
-            })
+        # Rows land in a DataFrame in one C-level pass, then the per-column
+        # work is vectorized instead of a Python loop per row
+        df = fetch_df(query)
+        if df.empty:
+            return []
 
-        return subjects_data
+        # Grade from the unrounded average, matching the scalar path
+        df['grade'] = Marks.calculate_grades(df['avg_percentage'].to_numpy())
+        df['avg_marks'] = df['avg_marks'].round(2)
+        df['avg_percentage'] = df['avg_percentage'].round(2)
+        return df.to_dict('records')
 
     @staticmethod
     def get_class_wise_performance() -> List[Dict]:
@@ -104,8 +135,8 @@ class PerformanceAnalytics:
         SELECT s.class, s.section,
                COUNT(DISTINCT s.student_id) as total_students,
                COUNT(m.mark_id) as total_assessments,
-               AVG((m.marks_obtained * 100.0) / m.max_marks) as avg_percentage,
-               SUM(CASE WHEN (m.marks_obtained * 100.0) / m.max_marks >= 40 THEN 1 ELSE 0 END) as pass_count,
+               AVG(m.pct) as avg_percentage,
+               SUM(m.pct >= 40) as pass_count,
                COUNT(DISTINCT m.student_id) as students_with_marks
         FROM Student s
         LEFT JOIN Marks m ON s.student_id = m.student_id
@@ -113,28 +144,20 @@ class PerformanceAnalytics:
         ORDER BY s.class, s.section
         """
 
-        results = fetch_all(query)
-
-        class_data = []
-        for result in results:
-            students_with_marks = result[6] if result[6] else 0
-            pass_percentage = 0
-
-            if students_with_marks > 0:
-                pass_percentage = (result[5] / students_with_marks) * 100
-
-            class_data.append({
-                'class': result[0],
-                'section': result[1],
-                'total_students': result[2],
-                'students_with_marks': students_with_marks,
-                'total_assessments': result[3] if result[3] else 0,
-                'avg_percentage': round(result[4], 2) if result[4] else 0,
-                'pass_count': result[5] if result[5] else 0,
-                'pass_percentage': round(pass_percentage, 2)
-            })
-
-        return class_data
+        df = fetch_df(query)
+        if df.empty:
+            return []
+
+        # Sections without marks come back NULL from the LEFT JOIN; fill the
+        # whole columns at once rather than checking per row
+        df['students_with_marks'] = df['students_with_marks'].fillna(0).astype(int)
+        df['total_assessments'] = df['total_assessments'].fillna(0).astype(int)
+        df['avg_percentage'] = df['avg_percentage'].fillna(0).round(2)
+        df['pass_count'] = df['pass_count'].fillna(0).astype(int)
+        df['pass_percentage'] = (
+            df['pass_count'] * 100.0 / df['students_with_marks'].replace(0, 1)
+        ).round(2)
+        return df.to_dict('records')
 
     @staticmethod
     def get_top_performers(limit: int = 10, class_name: str = None) -> List[Dict]:
@@ -150,55 +173,58 @@ class PerformanceAnalytics:
         if where_clause:
             where_clause = f"AND {where_clause}"
 
+        # Aggregate Marks once in a CTE (an index-only scan over the covering
+        # index), then join the small result against Student
         query = f"""
+        WITH agg AS (
+            SELECT student_id,
+                   SUM(marks_obtained) as total_obtained,
+                   SUM(max_marks) as total_max,
+                   COUNT(mark_id) as total_subjects
+            FROM Marks
+            GROUP BY student_id
+            HAVING SUM(max_marks) > 0
+        )
         SELECT s.student_id, s.name, s.class, s.section,
-               SUM(m.marks_obtained) as total_obtained,
-               SUM(m.max_marks) as total_max,
-               COUNT(m.mark_id) as total_subjects,
-               (SUM(m.marks_obtained) * 100.0) / SUM(m.max_marks) as percentage
+               agg.total_obtained, agg.total_max, agg.total_subjects,
+               (agg.total_obtained * 100.0) / agg.total_max as percentage
         FROM Student s
-        JOIN Marks m ON s.student_id = m.student_id
+        JOIN agg ON s.student_id = agg.student_id
         WHERE 1=1 {where_clause}
-        GROUP BY s.student_id, s.name, s.class, s.section
-        HAVING total_max > 0
         ORDER BY percentage DESC
         LIMIT ?
         """
 
         params.append(limit)
-        results = fetch_all(query, tuple(params))
-
-        top_performers = []
-        for i, result in enumerate(results):
-            percentage = result[7]
-            top_performers.append({
-                'rank': i + 1,
-                'student_id': result[0],
-                'name': result[1],
-                'class': result[2],
-                'section': result[3],
-                'total_obtained': result[4],
-                'total_max': result[5],
-                'total_subjects': result[6],
-                'percentage': round(percentage, 2),
-                'grade': Marks.calculate_grade(percentage)
-            })
+        df = fetch_df(query, tuple(params))
+        if df.empty:
+            return []
 
-        return top_performers
+        df.insert(0, 'rank', range(1, len(df) + 1))
+        # Grade from the unrounded percentage, matching the scalar path
+        df['grade'] = Marks.calculate_grades(df['percentage'].to_numpy())
+        df['percentage'] = df['percentage'].round(2)
+        return df.to_dict('records')
 
     @staticmethod
     def get_failing_students(threshold: float = 40.0) -> List[Dict]:
         """Get students who are failing (below threshold)"""
         query = """
+        WITH agg AS (
+            SELECT student_id,
+                   SUM(marks_obtained) as total_obtained,
+                   SUM(max_marks) as total_max,
+                   COUNT(mark_id) as total_subjects
+            FROM Marks
+            GROUP BY student_id
+            HAVING SUM(max_marks) > 0
+        )
         SELECT s.student_id, s.name, s.class, s.section,
-               SUM(m.marks_obtained) as total_obtained,
-               SUM(m.max_marks) as total_max,
-               COUNT(m.mark_id) as total_subjects,
-               (SUM(m.marks_obtained) * 100.0) / SUM(m.max_marks) as percentage
+               agg.total_obtained, agg.total_max, agg.total_subjects,
+               (agg.total_obtained * 100.0) / agg.total_max as percentage
         FROM Student s
-        JOIN Marks m ON s.student_id = m.student_id
-        GROUP BY s.student_id, s.name, s.class, s.section
-        HAVING percentage < ?
+        JOIN agg ON s.student_id = agg.student_id
+        WHERE (agg.total_obtained * 100.0) / agg.total_max < ?
         ORDER BY percentage ASC
         """
 
@@ -261,45 +287,88 @@ class PerformanceAnalytics:
     @staticmethod
     def get_overall_statistics() -> Dict:
         """Get overall system statistics"""
-        # Total students
-        total_students_query = "SELECT COUNT(*) FROM Student"
-        total_students = fetch_one(total_students_query)[0]
-
-        # Total subjects
-        total_subjects_query = "SELECT COUNT(*) FROM Subject"
-        total_subjects = fetch_one(total_subjects_query)[0]
-
-        # Total assessments
-        total_assessments_query = "SELECT COUNT(*) FROM Marks"
-        total_assessments = fetch_one(total_assessments_query)[0]
-
-        # Students with marks
-        students_with_marks_query = "SELECT COUNT(DISTINCT student_id) FROM Marks"
-        students_with_marks = fetch_one(students_with_marks_query)[0]
-
-        # Overall average
-        overall_avg_query = "SELECT AVG((marks_obtained * 100.0) / max_marks) FROM Marks"
-        overall_avg = fetch_one(overall_avg_query)[0]
-        overall_avg = round(overall_avg, 2) if overall_avg else 0
-
-        # Pass rate
-        pass_rate_query = """
-        SELECT 
-            (SUM(CASE WHEN (marks_obtained * 100.0) / max_marks >= 40 THEN 1 ELSE 0 END) * 100.0) / COUNT(*)
-        FROM Marks
+        # All six scalars come back in one round-trip instead of six
+        query = """
+        SELECT
+            (SELECT COUNT(*) FROM Student),
+            (SELECT COUNT(*) FROM Subject),
+            (SELECT COUNT(*) FROM Marks),
+            (SELECT COUNT(DISTINCT student_id) FROM Marks),
+            (SELECT AVG(pct) FROM Marks),
+            (SELECT AVG(pct >= 40) * 100.0 FROM Marks)
         """
-        pass_rate = fetch_one(pass_rate_query)[0]
-        pass_rate = round(pass_rate, 2) if pass_rate else 0
+        row = fetch_one(query)
+        if not row:
+            row = (0, 0, 0, 0, None, None)
+
+        overall_avg = round(row[4], 2) if row[4] else 0
+        pass_rate = round(row[5], 2) if row[5] else 0
 
         return {
-            'total_students': total_students,
-            'total_subjects': total_subjects,
-            'total_assessments': total_assessments,
-            'students_with_marks': students_with_marks,
+            'total_students': row[0],
+            'total_subjects': row[1],
+            'total_assessments': row[2],
+            'students_with_marks': row[3],
             'overall_average': overall_avg,
             'pass_rate': pass_rate
         }
 
+@st.cache_data(ttl=60, show_spinner=False)
+def get_dashboard_bundle() -> Dict:
+    """Everything the dashboard header and overview need, fetched as two
+    queries instead of three full-table reads plus Python loops"""
+    row = fetch_one("""
+    SELECT
+        (SELECT COUNT(*) FROM Student),
+        (SELECT COUNT(*) FROM Subject),
+        (SELECT COUNT(*) FROM Marks),
+        (SELECT COALESCE(SUM(marks_obtained) * 100.0 / NULLIF(SUM(max_marks), 0), 0) FROM Marks),
+        (SELECT COALESCE(SUM(ROUND(COALESCE(marks_obtained * 100.0 / NULLIF(max_marks, 0), 0), 2) >= 40) * 100.0
+                / NULLIF(COUNT(*), 0), 0)
+         FROM Marks)
+    """) or (0, 0, 0, 0, 0)
+
+    grade_rows = fetch_all(f"""
+    WITH per_mark AS (
+        SELECT ROUND(COALESCE(marks_obtained * 100.0 / NULLIF(max_marks, 0), 0), 2) as pct
+        FROM Marks
+    )
+    SELECT {PerformanceAnalytics.GRADE_CASE_SQL} as grade, COUNT(*)
+    FROM per_mark
+    GROUP BY grade
+    """)
+
+    return {
+        'student_count': row[0],
+        'subject_count': row[1],
+        'marks_count': row[2],
+        'overall_average': row[3],
+        'pass_rate': row[4],
+        'grade_counts': dict(grade_rows),
+    }
+
+# Cached entry points for the UI: reruns hit the cache for up to a minute
+# instead of re-running the aggregation queries
+@st.cache_data(ttl=60, show_spinner=False)
+def cached_grade_distribution(class_name: str = None, section: str = None) -> Dict:
+    return PerformanceAnalytics.get_grade_distribution(class_name, section)
+
+@st.cache_data(ttl=60, show_spinner=False)
+def cached_class_wise_performance() -> List[Dict]:
+    return PerformanceAnalytics.get_class_wise_performance()
+
+@st.cache_data(ttl=60, show_spinner=False)
+def cached_subject_performance_comparison() -> Dict:
+    return PerformanceAnalytics.get_subject_performance_comparison()
+
+@st.cache_data(ttl=60, show_spinner=False)
+def cached_top_performers(limit: int = 10, class_name: str = None) -> List[Dict]:
+    return PerformanceAnalytics.get_top_performers(limit, class_name)
+
+@st.cache_data(ttl=60, show_spinner=False)
+def cached_overall_statistics() -> Dict:
+    return PerformanceAnalytics.get_overall_statistics()
+
 def display_analytics_metrics(analytics_data: Dict) -> None:
     """Display analytics in metric format"""
     col1, col2, col3, col4 = st.columns(4)
@@ -1,250 +1,299 @@
-"""
-Data Import Utilities
-Helper functions for importing Excel and CSV files
-"""
-import pandas as pd
-import numpy as np
-from datetime import datetime, date
-import streamlit as st
-import sys
-import os
-
-# Add parent directory to path for imports
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
-from models.student import Student
-from models.subject import Subject
-from models.marks import Marks
-
-def read_file_data(uploaded_file):
-    """
-    Read data from uploaded file (CSV or Excel)
-    
-    Args:
-        uploaded_file: Streamlit uploaded file object
-        
-    Returns:
-        pandas.DataFrame: The data from the file
-    """
-    try:
-        if uploaded_file.name.endswith('.csv'):
-            df = pd.read_csv(uploaded_file)
-        else:
-            df = pd.read_excel(uploaded_file)
-        
-        # Clean column names (remove extra spaces, convert to title case)
-        df.columns = df.columns.str.strip().str.title()
-        
-        return df
-    except Exception as e:
-        raise Exception(f"Error reading file: {str(e)}")
-
-def create_sample_students_file():
-    """Create sample students data for download"""
-    sample_data = {
-        'Name': ['John Doe', 'Jane Smith', 'Mike Johnson', 'Sarah Wilson', 'David Brown'],
-        'Class': ['10', '11', '12', '10', '11'],
-        'Section': ['A', 'B', 'C', 'A', 'B'],
-        'DOB': ['2008-05-15', '2007-03-20', '2006-11-10', '2008-08-25', '2007-12-05']
-    }
-    return pd.DataFrame(sample_data)
-
-def create_sample_subjects_file():
-    """Create sample subjects data for download"""
-    sample_data = {
-        'Subject Name': ['Mathematics', 'Physics', 'Chemistry', 'Biology', 'English', 'History', 'Geography']
-    }
-    return pd.DataFrame(sample_data)
-
-def create_sample_marks_file():
-    """Create sample marks data for download"""
-    sample_data = {
-        'Student ID': [1, 1, 1, 2, 2, 2, 3, 3, 3],
-        'Subject ID': [1, 2, 3, 1, 2, 4, 2, 3, 5],
-        'Marks Obtained': [85, 78, 92, 88, 75, 82, 90, 85, 79],
-        'Max Marks': [100, 100, 100, 100, 100, 100, 100, 100, 100],
-        'Assessment Date': ['2024-01-15', '2024-01-16', '2024-01-17', '2024-01-15', '2024-01-16', '2024-01-18', '2024-01-16', '2024-01-17', '2024-01-19'],
-        'Assessment Type': ['Final', 'Final', 'Final', 'Final', 'Final', 'Final', 'Final', 'Final', 'Final']
-    }
-    return pd.DataFrame(sample_data)
-
-def get_file_requirements(import_type):
-    """
-    Get file requirements for different import types
-    
-    Args:
-        import_type (str): Type of import ('Students', 'Subjects', 'Marks')
-        
-    Returns:
-        dict: Requirements information
-    """
-    requirements = {
-        'Students': {
-            'required_columns': ['Name', 'Class', 'Section'],
-            'optional_columns': ['DOB'],
-            'description': 'Student information including name, class, section, and optional date of birth',
-            'format': {
-                'Name': 'Text (required)',
-                'Class': '10, 11, or 12 (required)',
-                'Section': 'A, B, or C (required)',
-                'DOB': 'YYYY-MM-DD format (optional)'
-            }
-        },
-        'Subjects': {
-            'required_columns': ['Subject Name'],
-            'optional_columns': [],
-            'description': 'Subject names for the curriculum',
-            'format': {
-                'Subject Name': 'Text, 2-50 characters (required)'
-            }
-        },
-        'Marks': {
-            'required_columns': ['Student ID', 'Subject ID', 'Marks Obtained', 'Max Marks'],
-            'optional_columns': ['Assessment Date', 'Assessment Type'],
-            'description': 'Student marks for different subjects',
-            'format': {
-                'Student ID': 'Number (must exist in system)',
-                'Subject ID': 'Number (must exist in system)',
-                'Marks Obtained': 'Number (0 or positive)',
-                'Max Marks': 'Number (greater than 0)',
-                'Assessment Date': 'YYYY-MM-DD format (optional)',
-                'Assessment Type': 'Text (optional, e.g., "Final", "Mid-term")'
-            }
-        }
-    }
-    
-    return requirements.get(import_type, {})
-
-def validate_dataframe_structure(df, import_type):
-    """
-    Validate DataFrame structure for import type
-    
-    Args:
-        df (pandas.DataFrame): Data to validate
-        import_type (str): Type of import
-        
-    Returns:
-        tuple: (is_valid, errors, warnings)
-    """
-    requirements = get_file_requirements(import_type)
-    errors = []
-    warnings = []
-    
-    if not requirements:
-        errors.append(f"Unknown import type: {import_type}")
-        return False, errors, warnings
-    
-    # Check required columns
-    required_columns = requirements['required_columns']
-    missing_columns = [col for col in required_columns if col not in df.columns]
-    if missing_columns:
-        errors.append(f"Missing required columns: {', '.join(missing_columns)}")
-    
-    # Check for extra columns
-    all_expected_columns = required_columns + requirements.get('optional_columns', [])
-    extra_columns = [col for col in df.columns if col not in all_expected_columns]
-    if extra_columns:
-        warnings.append(f"Extra columns found (will be ignored): {', '.join(extra_columns)}")
-    
-    return len(errors) == 0, errors, warnings
-
-def get_import_summary(import_type):
-    """
-    Get summary of current data for import type
-    
-    Args:
-        import_type (str): Type of import
-        
-    Returns:
-        dict: Summary information
-    """
-    try:
-        if import_type == "Students":
-            data = Student.get_all_students()
-            return {
-                'count': len(data),
-                'recent': data[-5:] if data else [],
-                'message': f"Currently {len(data)} students in the system"
-            }
-        elif import_type == "Subjects":
-            data = Subject.get_all_subjects()
-            return {
-                'count': len(data),
-                'recent': data[-5:] if data else [],
-                'message': f"Currently {len(data)} subjects in the system"
-            }
-        elif import_type == "Marks":
-            data = Marks.get_all_marks()
-            return {
-                'count': len(data),
-                'recent': data[-5:] if data else [],
-                'message': f"Currently {len(data)} marks records in the system"
-            }
-    except Exception as e:
-        return {
-            'count': 0,
-            'recent': [],
-            'message': f"Error getting data: {str(e)}"
-        }
-    
-    return {
-        'count': 0,
-        'recent': [],
-        'message': "No data available"
-    }
-
-def format_import_results(success_count, error_count, total_count, import_errors):
-    """
-    Format import results for display
-    
-    Args:
-        success_count (int): Number of successful imports
-        error_count (int): Number of failed imports
-        total_count (int): Total number of records
-        import_errors (list): List of error messages
-        
-    Returns:
-        dict: Formatted results
-    """
-    return {
-        'success_count': success_count,
-        'error_count': error_count,
-        'total_count': total_count,
-        'success_rate': (success_count / total_count * 100) if total_count > 0 else 0,
-        'errors': import_errors,
-        'summary': f"Successfully imported {success_count} out of {total_count} records ({success_count/total_count*100:.1f}% success rate)"
-    }
-
-def create_import_log(import_type, results, filename):
-    """
-    Create a log of the import operation
-    
-    Args:
-        import_type (str): Type of import
-        results (dict): Import results
-        filename (str): Original filename
-        
-    Returns:
-        str: Log content
-    """
-    log_content = f"""
-Import Log - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-==================================================
-File: {filename}
-Type: {import_type}
-Total Records: {results['total_count']}
-Successful: {results['success_count']}
-Failed: {results['error_count']}
-Success Rate: {results['success_rate']:.1f}%
-
-Errors:
-"""
-    
-    if results['errors']:
-        for error in results['errors']:
-            log_content += f"- {error}\n"
-    else:
-        log_content += "- None\n"
-    
-    return log_content
-
+"""
+Data Import Utilities
+Helper functions for importing Excel and CSV files
+"""
+import csv
+import io
+import sys
+import os
+from datetime import datetime
+
+# Parent directory joins sys.path once, so repeated imports never grow it;
+# pandas and the model classes load lazily inside the functions that need
+# them to keep importing this module cheap
+_PARENT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _PARENT_DIR not in sys.path:
+    sys.path.append(_PARENT_DIR)
+
+def read_file_data(uploaded_file):
+    """
+    Read data from uploaded file (CSV or Excel)
+    
+    Args:
+        uploaded_file: Streamlit uploaded file object
+        
+    Returns:
+        pandas.DataFrame: The data from the file
+    """
+    import pandas as pd
+
+    try:
+        if uploaded_file.name.endswith('.csv'):
+            try:
+                # The pyarrow engine parses multi-threaded
+                df = pd.read_csv(uploaded_file, engine='pyarrow')
+            except (ImportError, ValueError):
+                uploaded_file.seek(0)
+                df = pd.read_csv(uploaded_file)
+        else:
+            try:
+                # calamine streams the workbook in Rust instead of building a
+                # Python object per cell
+                df = pd.read_excel(uploaded_file, engine='calamine')
+            except (ImportError, ValueError):
+                uploaded_file.seek(0)
+                df = pd.read_excel(uploaded_file)
+
+        # Clean column names (remove extra spaces, convert to title case)
+        df.columns = df.columns.str.strip().str.title()
+
+        return df
+    except Exception as e:
+        raise Exception(f"Error reading file: {str(e)}")
+
+# Sample rows are fixed constants, so their CSV bytes are built once at
+# module load with the stdlib writer - downloads never need a DataFrame
+SAMPLE_STUDENTS_HEADERS = ('Name', 'Class', 'Section', 'DOB')
+SAMPLE_STUDENTS_ROWS = (
+    ('John Doe', '10', 'A', '2008-05-15'),
+    ('Jane Smith', '11', 'B', '2007-03-20'),
+    ('Mike Johnson', '12', 'C', '2006-11-10'),
+    ('Sarah Wilson', '10', 'A', '2008-08-25'),
+    ('David Brown', '11', 'B', '2007-12-05'),
+)
+
+SAMPLE_SUBJECTS_HEADERS = ('Subject Name',)
+SAMPLE_SUBJECTS_ROWS = (
+    ('Mathematics',), ('Physics',), ('Chemistry',), ('Biology',),
+    ('English',), ('History',), ('Geography',),
+)
+
+SAMPLE_MARKS_HEADERS = ('Student ID', 'Subject ID', 'Marks Obtained', 'Max Marks',
+                        'Assessment Date', 'Assessment Type')
+SAMPLE_MARKS_ROWS = (
+    (1, 1, 85, 100, '2024-01-15', 'Final'),
+    (1, 2, 78, 100, '2024-01-16', 'Final'),
+    (1, 3, 92, 100, '2024-01-17', 'Final'),
+    (2, 1, 88, 100, '2024-01-15', 'Final'),
+    (2, 2, 75, 100, '2024-01-16', 'Final'),
+    (2, 4, 82, 100, '2024-01-18', 'Final'),
+    (3, 2, 90, 100, '2024-01-16', 'Final'),
+    (3, 3, 85, 100, '2024-01-17', 'Final'),
+    (3, 5, 79, 100, '2024-01-19', 'Final'),
+)
+
+def _rows_to_csv_bytes(headers, rows):
+    """Stream rows through csv.writer - no DataFrame or to_csv copy in between"""
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+    writer.writerow(headers)
+    writer.writerows(rows)
+    return buf.getvalue().encode()
+
+SAMPLE_STUDENTS_CSV = _rows_to_csv_bytes(SAMPLE_STUDENTS_HEADERS, SAMPLE_STUDENTS_ROWS)
+SAMPLE_SUBJECTS_CSV = _rows_to_csv_bytes(SAMPLE_SUBJECTS_HEADERS, SAMPLE_SUBJECTS_ROWS)
+SAMPLE_MARKS_CSV = _rows_to_csv_bytes(SAMPLE_MARKS_HEADERS, SAMPLE_MARKS_ROWS)
+
+def create_sample_students_file():
+    """Create sample students data for download"""
+    import pandas as pd
+    return pd.DataFrame(list(SAMPLE_STUDENTS_ROWS), columns=list(SAMPLE_STUDENTS_HEADERS))
+
+def create_sample_subjects_file():
+    """Create sample subjects data for download"""
+    import pandas as pd
+    return pd.DataFrame(list(SAMPLE_SUBJECTS_ROWS), columns=list(SAMPLE_SUBJECTS_HEADERS))
+
+def create_sample_marks_file():
+    """Create sample marks data for download"""
+    import pandas as pd
+    return pd.DataFrame(list(SAMPLE_MARKS_ROWS), columns=list(SAMPLE_MARKS_HEADERS))
+
+def get_file_requirements(import_type):
+    """
+    Get file requirements for different import types
+    
+    Args:
+        import_type (str): Type of import ('Students', 'Subjects', 'Marks')
+        
+    Returns:
+        dict: Requirements information
+    """
+    requirements = {
+        'Students': {
+            'required_columns': ['Name', 'Class', 'Section'],
+            'optional_columns': ['DOB'],
+            'description': 'Student information including name, class, section, and optional date of birth',
+            'format': {
+                'Name': 'Text (required)',
+                'Class': '10, 11, or 12 (required)',
+                'Section': 'A, B, or C (required)',
+                'DOB': 'YYYY-MM-DD format (optional)'
+            }
+        },
+        'Subjects': {
+            'required_columns': ['Subject Name'],
+            'optional_columns': [],
+            'description': 'Subject names for the curriculum',
+            'format': {
+                'Subject Name': 'Text, 2-50 characters (required)'
+            }
+        },
+        'Marks': {
+            'required_columns': ['Student ID', 'Subject ID', 'Marks Obtained', 'Max Marks'],
+            'optional_columns': ['Assessment Date', 'Assessment Type'],
+            'description': 'Student marks for different subjects',
+            'format': {
+                'Student ID': 'Number (must exist in system)',
+                'Subject ID': 'Number (must exist in system)',
+                'Marks Obtained': 'Number (0 or positive)',
+                'Max Marks': 'Number (greater than 0)',
+                'Assessment Date': 'YYYY-MM-DD format (optional)',
+                'Assessment Type': 'Quiz, Assignment, Midterm, Final, or Project (optional)'
+            }
+        }
+    }
+    
+    return requirements.get(import_type, {})
+
+def validate_dataframe_structure(df, import_type):
+    """
+    Validate DataFrame structure for import type
+    
+    Args:
+        df (pandas.DataFrame): Data to validate
+        import_type (str): Type of import
+        
+    Returns:
+        tuple: (is_valid, errors, warnings)
+    """
+    requirements = get_file_requirements(import_type)
+    errors = []
+    warnings = []
+    
+    if not requirements:
+        errors.append(f"Unknown import type: {import_type}")
+        return False, errors, warnings
+    
+    # Check required columns against a set so each test is one hash lookup
+    # instead of a scan over the column index
+    columns = set(df.columns)
+    required_columns = requirements['required_columns']
+    missing_columns = [col for col in required_columns if col not in columns]
+    if missing_columns:
+        errors.append(f"Missing required columns: {', '.join(missing_columns)}")
+
+    # Check for extra columns
+    expected_columns = set(required_columns).union(requirements.get('optional_columns', []))
+    extra_columns = [col for col in df.columns if col not in expected_columns]
+    if extra_columns:
+        warnings.append(f"Extra columns found (will be ignored): {', '.join(extra_columns)}")
+    
+    return len(errors) == 0, errors, warnings
+
+def get_import_summary(import_type):
+    """
+    Get summary of current data for import type
+    
+    Args:
+        import_type (str): Type of import
+        
+    Returns:
+        dict: Summary information
+    """
+    from models.student import Student
+    from models.subject import Subject
+    from models.marks import Marks
+
+    try:
+        # Count and recent rows come from two small queries instead of
+        # materializing the whole table
+        if import_type == "Students":
+            count = Student.count()
+            return {
+                'count': count,
+                'recent': Student.recent(5),
+                'message': f"Currently {count} students in the system"
+            }
+        elif import_type == "Subjects":
+            count = Subject.count()
+            return {
+                'count': count,
+                'recent': Subject.recent(5),
+                'message': f"Currently {count} subjects in the system"
+            }
+        elif import_type == "Marks":
+            count = Marks.count()
+            return {
+                'count': count,
+                'recent': Marks.recent(5),
+                'message': f"Currently {count} marks records in the system"
+            }
+    except Exception as e:
+        return {
+            'count': 0,
+            'recent': [],
+            'message': f"Error getting data: {str(e)}"
+        }
+    
+    return {
+        'count': 0,
+        'recent': [],
+        'message': "No data available"
+    }
+
+def format_import_results(success_count, error_count, total_count, import_errors):
+    """
+    Format import results for display
+    
+    Args:
+        success_count (int): Number of successful imports
+        error_count (int): Number of failed imports
+        total_count (int): Total number of records
+        import_errors (list): List of error messages
+        
+    Returns:
+        dict: Formatted results
+    """
+    return {
+        'success_count': success_count,
+        'error_count': error_count,
+        'total_count': total_count,
+        'success_rate': (success_count / total_count * 100) if total_count > 0 else 0,
+        'errors': import_errors,
+        'summary': f"Successfully imported {success_count} out of {total_count} records ({success_count/total_count*100:.1f}% success rate)"
+    }
+
+def create_import_log(import_type, results, filename):
+    """
+    Create a log of the import operation
+    
+    Args:
+        import_type (str): Type of import
+        results (dict): Import results
+        filename (str): Original filename
+        
+    Returns:
+        str: Log content
+    """
+    log_content = f"""
+Import Log - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+==================================================
+File: {filename}
+Type: {import_type}
+Total Records: {results['total_count']}
+Successful: {results['success_count']}
+Failed: {results['error_count']}
+Success Rate: {results['success_rate']:.1f}%
+
+Errors:
+"""
+    
+    if results['errors']:
+        for error in results['errors']:
+            log_content += f"- {error}\n"
+    else:
+        log_content += "- None\n"
+    
+    return log_content
+
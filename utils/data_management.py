@@ -1,137 +1,181 @@
-"""
-Data Management Utilities - Helper functions for managing application data
-"""
-import streamlit as st
-from db.connection import execute_query, fetch_one, fetch_all
-from models.student import Student
-from models.subject import Subject
-from models.marks import Marks
-
-def is_sample_data_present():
-    """
-    Check if sample data exists in the database
-    Returns: bool - True if sample data exists, False otherwise
-    """
-    try:
-        # Check for sample students (the sample data has 10 specific students)
-        sample_student_names = [
-            "Aarav Sharma", "Priya Patel", "Rohit Kumar", "Sneha Singh", 
-            "Vikram Rao", "Anita Desai", "Kiran Reddy", "Meera Joshi", 
-            "Arjun Nair", "Deepika Gupta"
-        ]
-        
-        # Check if any of these sample names exist
-        for name in sample_student_names:
-            result = fetch_one("SELECT COUNT(*) FROM Student WHERE name = ?", (name,))
-            if result and result[0] > 0:
-                return True
-        
-        return False
-    except Exception as e:
-        st.error(f"Error checking sample data: {str(e)}")
-        return False
-
-def get_sample_data_info():
-    """
-    Get information about sample data in the database
-    Returns: dict with sample data statistics
-    """
-    try:
-        students = Student.get_all_students()
-        subjects = Subject.get_all_subjects()
-        marks = Marks.get_all_marks()
-        
-        return {
-            'student_count': len(students) if students else 0,
-            'subject_count': len(subjects) if subjects else 0,
-            'marks_count': len(marks) if marks else 0,
-            'is_sample_data': is_sample_data_present()
-        }
-    except Exception as e:
-        st.error(f"Error getting sample data info: {str(e)}")
-        return {
-            'student_count': 0,
-            'subject_count': 0,
-            'marks_count': 0,
-            'is_sample_data': False
-        }
-
-def delete_sample_data():
-    """
-    Delete all sample data from the database
-    Returns: bool - True if successful, False otherwise
-    """
-    try:
-        # Delete in order due to foreign key constraints
-        execute_query("DELETE FROM Marks")
-        execute_query("DELETE FROM Student")
-        execute_query("DELETE FROM Subject")
-        
-        return True
-    except Exception as e:
-        st.error(f"Error deleting sample data: {str(e)}")
-        return False
-
-def reset_to_sample_data():
-    """
-    Clear existing data and restore fresh sample data
-    Returns: bool - True if successful, False otherwise
-    """
-    try:
-        from db.connection import initialize_sample_data
-        
-        # Clear existing data
-        execute_query("DELETE FROM Marks")
-        execute_query("DELETE FROM Student")
-        execute_query("DELETE FROM Subject")
-        
-        # Reinitialize with sample data
-        return initialize_sample_data()
-    except Exception as e:
-        st.error(f"Error resetting to sample data: {str(e)}")
-        return False
-
-def get_data_summary():
-    """
-    Get a comprehensive summary of all data in the database
-    Returns: dict with data summary
-    """
-    try:
-        students = Student.get_all_students()
-        subjects = Subject.get_all_subjects()
-        marks = Marks.get_all_marks()
-        
-        # Calculate additional statistics
-        if marks:
-            total_marks = sum(mark[3] for mark in marks)
-            max_possible = sum(mark[4] for mark in marks)
-            average_percentage = (total_marks / max_possible * 100) if max_possible > 0 else 0
-            
-            # Grade distribution
-            grade_counts = {}
-            for mark in marks:
-                percentage = Marks.calculate_percentage(mark[3], mark[4])
-                grade = Marks.calculate_grade(percentage)
-                grade_counts[grade] = grade_counts.get(grade, 0) + 1
-        else:
-            average_percentage = 0
-            grade_counts = {}
-        
-        return {
-            'total_students': len(students) if students else 0,
-            'total_subjects': len(subjects) if subjects else 0,
-            'total_assessments': len(marks) if marks else 0,
-            'average_percentage': round(average_percentage, 2),
-            'grade_distribution': grade_counts,
-            'is_sample_data': is_sample_data_present()
-        }
-    except Exception as e:
-        st.error(f"Error getting data summary: {str(e)}")
-        return {
-            'total_students': 0,
-            'total_subjects': 0,
-            'total_assessments': 0,
-            'average_percentage': 0,
-            'grade_distribution': {},
-            'is_sample_data': False
-        }
+"""
+Data Management Utilities - Helper functions for managing application data
+"""
+import streamlit as st
+from db.connection import execute_query, execute_script, fetch_one, fetch_all, db_is_empty
+
+# The sample data seeds these 10 specific students; kept at module level so
+# the probe query reuses one tuple instead of rebuilding the list per call
+SAMPLE_STUDENT_NAMES = (
+    "Aarav Sharma", "Priya Patel", "Rohit Kumar", "Sneha Singh",
+    "Vikram Rao", "Anita Desai", "Kiran Reddy", "Meera Joshi",
+    "Arjun Nair", "Deepika Gupta"
+)
+
+@st.cache_data(ttl=60, show_spinner=False)
+def is_sample_data_present():
+    """
+    Check if sample data exists in the database
+    Returns: bool - True if sample data exists, False otherwise
+    """
+    try:
+        # Empty table: answer without building or running the IN probe
+        any_student = fetch_one("SELECT EXISTS(SELECT 1 FROM Student)")
+        if not any_student or not any_student[0]:
+            return False
+
+        # One IN query probes all sample names in a single round-trip
+        # instead of one SELECT per name
+        placeholders = ", ".join("?" * len(SAMPLE_STUDENT_NAMES))
+        result = fetch_one(
+            f"SELECT 1 FROM Student WHERE name IN ({placeholders}) LIMIT 1",
+            SAMPLE_STUDENT_NAMES
+        )
+        return result is not None
+    except Exception as e:
+        st.error(f"Error checking sample data: {str(e)}")
+        return False
+
+def get_sample_data_info():
+    """
+    Get information about sample data in the database
+    Returns: dict with sample data statistics
+
+    Thin projection over get_data_summary's cached result; kept for existing
+    callers, prefer get_data_summary in new code.
+    """
+    summary = get_data_summary()
+    return {
+        'student_count': summary['total_students'],
+        'subject_count': summary['total_subjects'],
+        'marks_count': summary['total_assessments'],
+        'is_sample_data': summary['is_sample_data']
+    }
+
+def _invalidate_summary_caches():
+    """Drop every cached summary after a mutation so no stale counts or
+    flags survive into the next rerun"""
+    get_data_summary.clear()
+    is_sample_data_present.clear()
+
+def delete_sample_data():
+    """
+    Delete all sample data from the database
+    Returns: bool - True if successful, False otherwise
+    """
+    try:
+        # One transaction (single commit/fsync) instead of four autocommits;
+        # deletes ordered for the foreign key constraints. The tables carry
+        # no triggers, so the bare DELETEs take SQLite's O(1) truncate path
+        # instead of journaling row by row; clearing sqlite_sequence restarts
+        # the AUTOINCREMENT ids at 1 for the next import
+        success = execute_script("""
+            DELETE FROM Marks;
+            DELETE FROM Student;
+            DELETE FROM Subject;
+            DELETE FROM Meta WHERE key = 'sample_marker';
+            DELETE FROM sqlite_sequence WHERE name IN ('Marks', 'Student', 'Subject');
+        """)
+
+        _invalidate_summary_caches()
+        return success
+    except Exception as e:
+        st.error(f"Error deleting sample data: {str(e)}")
+        return False
+
+def reset_to_sample_data():
+    """
+    Clear existing data and restore fresh sample data
+    Returns: bool - True if successful, False otherwise
+    """
+    try:
+        from db.connection import initialize_sample_data
+
+        # Clear existing data in one transaction (triggerless tables, so the
+        # bare DELETEs truncate in O(1)); resetting sqlite_sequence matters
+        # here because initialize_sample_data assumes student ids 1-10
+        execute_script("""
+            DELETE FROM Marks;
+            DELETE FROM Student;
+            DELETE FROM Subject;
+            DELETE FROM sqlite_sequence WHERE name IN ('Marks', 'Student', 'Subject');
+        """)
+
+        # Reinitialize with sample data
+        success = initialize_sample_data()
+
+        _invalidate_summary_caches()
+        return success
+    except Exception as e:
+        st.error(f"Error resetting to sample data: {str(e)}")
+        return False
+
+@st.cache_data(ttl=30, show_spinner=False)
+def get_data_summary():
+    """
+    Get a comprehensive summary of all data in the database
+    Returns: dict with data summary
+    """
+    try:
+        # First-run fast path: one EXISTS probe instead of the fused
+        # aggregate queries when the database holds nothing yet
+        if db_is_empty():
+            return {
+                'total_students': 0,
+                'total_subjects': 0,
+                'total_assessments': 0,
+                'average_percentage': 0,
+                'grade_distribution': {},
+                'is_sample_data': False
+            }
+
+        # Aggregate in SQLite so only the summary row crosses into Python;
+        # the sample flag rides along as an EXISTS instead of its own query
+        placeholders = ", ".join("?" * len(SAMPLE_STUDENT_NAMES))
+        totals = fetch_one(f"""
+            SELECT (SELECT COUNT(*) FROM Student),
+                   (SELECT COUNT(*) FROM Subject),
+                   COUNT(*),
+                   COALESCE(SUM(marks_obtained) * 100.0 / NULLIF(SUM(max_marks), 0), 0),
+                   EXISTS(SELECT 1 FROM Meta WHERE key = 'sample_marker')
+                       OR EXISTS(SELECT 1 FROM Student WHERE name IN ({placeholders}))
+            FROM Marks
+        """, SAMPLE_STUDENT_NAMES)
+        if totals is None:
+            raise RuntimeError("summary query returned no row")
+
+        # Grade bucketing in SQL replaces the per-mark Python grading loop;
+        # the generated pct column saves recomputing the division per branch
+        grade_counts = dict(fetch_all("""
+            SELECT CASE
+                       WHEN pct >= 90 THEN 'A+'
+                       WHEN pct >= 80 THEN 'A'
+                       WHEN pct >= 70 THEN 'B+'
+                       WHEN pct >= 60 THEN 'B'
+                       WHEN pct >= 50 THEN 'C+'
+                       WHEN pct >= 40 THEN 'C'
+                       ELSE 'F'
+                   END AS grade,
+                   COUNT(*)
+            FROM Marks
+            GROUP BY grade
+        """))
+
+        return {
+            'total_students': totals[0],
+            'total_subjects': totals[1],
+            'total_assessments': totals[2],
+            'average_percentage': round(totals[3], 2),
+            'grade_distribution': grade_counts,
+            'is_sample_data': bool(totals[4])
+        }
+    except Exception as e:
+        st.error(f"Error getting data summary: {str(e)}")
+        return {
+            'total_students': 0,
+            'total_subjects': 0,
+            'total_assessments': 0,
+            'average_percentage': 0,
+            'grade_distribution': {},
+            'is_sample_data': False
+        }